@@ -21,12 +21,15 @@ What this script does
 
 Usage
 -----
-  Windows:   python install.py
-  Linux:     python3 install.py
+  Windows:   python install.py [--dev]
+  Linux:     python3 install.py [--dev]
+
+  ``--dev`` additionally installs the test and lint tools (pytest, ruff, ...).
 """
 
 from __future__ import annotations
 
+import argparse
 import os
 import platform
 import subprocess
@@ -41,6 +44,8 @@ from pathlib import Path
 MINIMUM_PYTHON = (3, 8)
 VENV_DIR = Path(".venv")
 SCRIPT_DIR = Path(__file__).resolve().parent
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
 
 
 # ---------------------------------------------------------------------------
@@ -111,14 +116,14 @@ def create_venv() -> Path:
 
 def _venv_python(venv: Path) -> Path:
     """Return the path to the Python executable inside *venv*."""
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         return venv / "Scripts" / "python.exe"
     return venv / "bin" / "python"
 
 
 def _venv_pip(venv: Path) -> Path:
     """Return the path to the pip executable inside *venv*."""
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         return venv / "Scripts" / "pip.exe"
     return venv / "bin" / "pip"
 
@@ -134,17 +139,21 @@ def upgrade_pip(venv: Path) -> None:
     print("  ✓ pip upgraded")
 
 
-def install_package(venv: Path) -> None:
+def install_package(venv: Path, dev: bool = False) -> None:
     _print_step("4/5", "Installing file_chopper and its dependencies")
-    # Install in editable mode so the source tree is used directly.
+    # Install in editable mode so the source tree is used directly.  Wheels
+    # are preferred over source builds, and bytecode is compiled lazily on
+    # first import instead of for every installed module up front.
     _run(
         [
             str(_venv_python(venv)),
             "-m",
             "pip",
             "install",
+            "--prefer-binary",
+            "--no-compile",
             "--editable",
-            f"{SCRIPT_DIR}[dev]",
+            f"{SCRIPT_DIR}[dev]" if dev else str(SCRIPT_DIR),
         ]
     )
     print("  ✓ file_chopper installed")
@@ -158,9 +167,7 @@ def install_package(venv: Path) -> None:
 def create_launcher(venv: Path) -> None:
     _print_step("5/5", "Creating platform launcher")
 
-    system = platform.system()
-
-    if system == "Windows":
+    if _IS_WINDOWS:
         _create_windows_launcher(venv)
     else:
         _create_linux_launcher(venv)
@@ -168,12 +175,14 @@ def create_launcher(venv: Path) -> None:
 
 def _create_windows_launcher(venv: Path) -> None:
     bat_path = SCRIPT_DIR / "run_file_chopper.bat"
-    venv_python = venv / "Scripts" / "python.exe"
+    # Call the console-script stub created by pip directly: it imports only
+    # file_chopper.main:cli, skipping the runpy machinery behind "python -m".
+    venv_chopper = venv / "Scripts" / "file_chopper.exe"
     content = textwrap.dedent(
         f"""\
         @echo off
         REM file_chopper launcher — generated by install.py
-        "{venv_python}" -m file_chopper.main %*
+        "{venv_chopper}" %*
         """
     )
     bat_path.write_text(content, encoding="utf-8")
@@ -182,12 +191,12 @@ def _create_windows_launcher(venv: Path) -> None:
 
 def _create_linux_launcher(venv: Path) -> None:
     sh_path = SCRIPT_DIR / "run_file_chopper.sh"
-    venv_python = venv / "bin" / "python"
+    venv_chopper = venv / "bin" / "file_chopper"
     content = textwrap.dedent(
         f"""\
         #!/usr/bin/env bash
         # file_chopper launcher — generated by install.py
-        exec "{venv_python}" -m file_chopper.main "$@"
+        exec "{venv_chopper}" "$@"
         """
     )
     sh_path.write_text(content, encoding="utf-8")
@@ -201,16 +210,15 @@ def _create_linux_launcher(venv: Path) -> None:
 
 
 def print_instructions(venv: Path) -> None:
-    system = platform.system()
     activate_cmd = (
-        r".venv\Scripts\activate" if system == "Windows" else "source .venv/bin/activate"
+        r".venv\Scripts\activate" if _IS_WINDOWS else "source .venv/bin/activate"
     )
     run_cmd = (
-        r"run_file_chopper.bat" if system == "Windows" else "./run_file_chopper.sh"
+        r"run_file_chopper.bat" if _IS_WINDOWS else "./run_file_chopper.sh"
     )
     venv_chopper = (
         str(venv / "Scripts" / "file_chopper.exe")
-        if system == "Windows"
+        if _IS_WINDOWS
         else str(venv / "bin" / "file_chopper")
     )
 
@@ -247,6 +255,14 @@ def print_instructions(venv: Path) -> None:
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Install file_chopper into a local venv.")
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Also install the development tools (tests and linting).",
+    )
+    args = parser.parse_args()
+
     _print_header("file_chopper — Installation")
 
     os.chdir(SCRIPT_DIR)
@@ -254,7 +270,7 @@ def main() -> None:
     check_python_version()
     venv = create_venv()
     upgrade_pip(venv)
-    install_package(venv)
+    install_package(venv, dev=args.dev)
     create_launcher(venv)
     print_instructions(venv)
 
@@ -4,10 +4,20 @@ Core file splitting and joining logic for file_chopper.
 
 from __future__ import annotations
 
+import contextlib
+import errno
 import hashlib
+import mmap
+import os
+import queue
 import re
+import stat
+import struct
+import sys
+import threading
+from itertools import accumulate
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -16,10 +26,76 @@ from typing import List, Optional
 
 PART_SUFFIX_TEMPLATE = ".part{index:04d}"
 PART_PATTERN = re.compile(r"^(.+)\.part(\d{4})$")
+_PART_MARKER = ".part"
+_PART_TAIL_LEN = len(_PART_MARKER) + 4
+
+_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([A-Za-z]*)")
+_SIZE_UNITS = {
+    "B": 1,
+    "K": 1024,
+    "KB": 1024,
+    "M": 1024**2,
+    "MB": 1024**2,
+    "G": 1024**3,
+    "GB": 1024**3,
+    "T": 1024**4,
+    "TB": 1024**4,
+}
+_FORMAT_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 # Default read/write buffer size (4 MiB)
 BUFFER_SIZE = 4 * 1024 * 1024
 
+# Read size for hashing whole files (16 MiB).  hashlib drops the GIL while
+# digesting, so fewer, larger updates leave more time for other threads.
+_HASH_BUFFER_SIZE = 16 * 1024 * 1024
+
+# Smallest source that a checksummed chop memory-maps (16 MiB).  Below it,
+# setting up and tearing down the mapping costs more than the buffer copies
+# it saves.
+_MMAP_MIN_SIZE = 16 * 1024 * 1024
+
+# Windows opens low-level file descriptors in text mode unless told otherwise.
+O_BINARY = getattr(os, "O_BINARY", 0)
+
+# Page-cache hints for streaming reads (Linux and most Unixes; None elsewhere).
+_FADV_SEQUENTIAL = getattr(os, "POSIX_FADV_SEQUENTIAL", None)
+_FADV_DONTNEED = getattr(os, "POSIX_FADV_DONTNEED", None)
+_MADV_WILLNEED = getattr(mmap, "MADV_WILLNEED", None)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux FICLONERANGE ioctl: share a block-aligned range of extents between two
+# files on the same copy-on-write filesystem (btrfs, XFS with reflink, ...).
+_FICLONERANGE = 0x4020940D if sys.platform.startswith("linux") else None
+
+# macOS F_PREALLOCATE fcntl (not exported by the fcntl module) and the flags
+# of its fstore_t argument, for systems without posix_fallocate().
+_F_PREALLOCATE = 42 if sys.platform == "darwin" else None
+_F_ALLOCATECONTIG = 0x2
+_F_ALLOCATEALL = 0x4
+_F_PEOFPOSMODE = 3
+
+# Only Linux sendfile() writes to regular files; macOS and the BSDs require a
+# socket as the destination.
+_SENDFILE_TO_FILE = sys.platform.startswith("linux")
+
+# Errors that mean "this copy primitive is not usable here" rather than a real
+# I/O failure; the next, more portable primitive is tried instead.
+_COPY_FALLBACK_ERRNOS = frozenset(
+    getattr(errno, name)
+    for name in ("EXDEV", "EINVAL", "ENOSYS", "EOPNOTSUPP", "ENOTSUP", "EBADF", "ENOTSOCK")
+    if hasattr(errno, name)
+)
+
+# stat() errors that mean "there is no such file": a missing path, a file used
+# as a directory component, or a looping symlink.  Anything else (EACCES, EIO,
+# ...) is a real error and is reported as such.
+NOT_FOUND_ERRNOS = frozenset((errno.ENOENT, errno.ENOTDIR, errno.ELOOP))
+
 
 # ---------------------------------------------------------------------------
 # Helper utilities
@@ -48,18 +124,9 @@ def parse_size(size_str: str) -> int:
         When *size_str* cannot be parsed.
     """
     size_str = size_str.strip()
-    units = {
-        "B": 1,
-        "K": 1024,
-        "KB": 1024,
-        "M": 1024**2,
-        "MB": 1024**2,
-        "G": 1024**3,
-        "GB": 1024**3,
-        "T": 1024**4,
-        "TB": 1024**4,
-    }
-    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([A-Za-z]*)", size_str)
+    if size_str.isdecimal():
+        return int(size_str)
+    match = _SIZE_RE.fullmatch(size_str)
     if not match:
         raise ValueError(
             f"Cannot parse size '{size_str}'. "
@@ -68,35 +135,389 @@ def parse_size(size_str: str) -> int:
     number_str, unit = match.group(1), match.group(2).upper()
     if unit == "":
         unit = "B"
-    if unit not in units:
+    if unit not in _SIZE_UNITS:
         raise ValueError(
             f"Unknown size unit '{unit}'. "
-            f"Supported units: {', '.join(units.keys())}."
+            f"Supported units: {', '.join(_SIZE_UNITS.keys())}."
         )
-    return int(float(number_str) * units[unit])
+    return int(float(number_str) * _SIZE_UNITS[unit])
 
 
 def format_size(num_bytes: int) -> str:
     """Return a human-readable representation of *num_bytes*."""
-    for unit in ("B", "KB", "MB", "GB", "TB"):
-        if num_bytes < 1024 or unit == "TB":
-            return f"{num_bytes:.1f} {unit}" if unit != "B" else f"{num_bytes} B"
-        num_bytes //= 1024
-    return f"{num_bytes} B"  # unreachable but satisfies type checkers
+    if num_bytes < 1024:
+        return f"{num_bytes} B"
+    # Each unit is 2**10 times the previous one, so the bit length picks it.
+    index = min(len(_FORMAT_UNITS) - 1, (num_bytes.bit_length() - 1) // 10)
+    return f"{num_bytes >> (10 * index):.1f} {_FORMAT_UNITS[index]}"
 
 
 def sha256_of_file(path: Path) -> str:
     """Return the SHA-256 hex digest of a file."""
-    digest = hashlib.sha256()
-    with path.open("rb") as fh:
-        while True:
-            chunk = fh.read(BUFFER_SIZE)
-            if not chunk:
-                break
-            digest.update(chunk)
+    with Path(path).open("rb", buffering=0) as fh:
+        fd = fh.fileno()
+        size = os.fstat(fd).st_size
+        _fadvise(fd, _FADV_SEQUENTIAL)
+        mapped = _map_source(fd, size)
+        if mapped is not None:
+            # Large files are hashed straight from the page cache in a single
+            # update, without copying them through a user-space buffer.
+            with mapped:
+                digest = hashlib.sha256(mapped)
+        else:
+            # hashlib.file_digest() is the same loop with a 256 KiB buffer; a
+            # larger one means each update hashes longer with the GIL
+            # released.  Small files get a buffer of their own size.
+            digest = hashlib.sha256()
+            buf = bytearray(min(_HASH_BUFFER_SIZE, size) or 1)
+            view = memoryview(buf)
+            while True:
+                n = fh.readinto(buf)
+                if not n:
+                    break
+                digest.update(view[:n])
+        _fadvise(fd, _FADV_DONTNEED)
     return digest.hexdigest()
 
 
+def match_part(name: str) -> Optional[Tuple[str, int]]:
+    """Split a part file name into ``(base_name, index)``.
+
+    Equivalent to matching :data:`PART_PATTERN`, but the suffix has a fixed
+    width so plain slicing does the job without the regex engine.  Returns
+    ``None`` when *name* is not a part file name.
+    """
+    if len(name) <= _PART_TAIL_LEN or name[-_PART_TAIL_LEN:-4] != _PART_MARKER:
+        return None
+    digits = name[-4:]
+    if not digits.isdecimal():
+        return None
+    return name[:-_PART_TAIL_LEN], int(digits)
+
+
+def _fadvise(fd: int, advice: Optional[int], offset: int = 0, length: int = 0) -> None:
+    """Give the kernel a page-cache *advice* hint for *fd*, if supported.
+
+    Files are streamed exactly once, so callers announce sequential access
+    before reading and drop the cached pages afterwards instead of letting
+    them evict more useful data.  Hints are best-effort and never fail.
+    """
+    if advice is None:
+        return
+    with contextlib.suppress(OSError):
+        os.posix_fadvise(fd, offset, length, advice)
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve *size* bytes of disk space for *fd* up front, if supported.
+
+    Allocating the final extent in one call lets the filesystem lay the file
+    out contiguously and spares it from extending the file on every write.
+    Filesystems that cannot preallocate are simply written to as usual.
+    """
+    if size <= 0:
+        return
+    if not hasattr(os, "posix_fallocate"):
+        _preallocate_darwin(fd, size)
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError as exc:
+        if exc.errno not in _COPY_FALLBACK_ERRNOS:
+            raise
+
+
+def _preallocate_darwin(fd: int, size: int) -> None:
+    """macOS counterpart of :func:`_preallocate` using ``F_PREALLOCATE``.
+
+    Asks for one contiguous extent first and settles for any extents if the
+    filesystem cannot provide it.  The file size is left unchanged; the
+    reserved space is consumed by the writes that follow.
+    """
+    if _F_PREALLOCATE is None or fcntl is None:
+        return
+    for flags in (_F_ALLOCATECONTIG | _F_ALLOCATEALL, _F_ALLOCATEALL):
+        # fstore_t: fst_flags, fst_posmode, fst_offset, fst_length, fst_bytesalloc
+        fstore = struct.pack("Iiqqq", flags, _F_PEOFPOSMODE, 0, size, 0)
+        try:
+            fcntl.fcntl(fd, _F_PREALLOCATE, fstore)
+            return
+        except OSError:
+            # Out of contiguous space, or not supported by this filesystem:
+            # retry without the contiguity requirement, then write as usual.
+            continue
+
+
+def write_all(fd: int, data) -> None:
+    """Write all of *data* to *fd*, retrying after short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def copy_range(src_fd: int, dst_fd: int, offset: int, count: int) -> None:
+    """Copy *count* bytes starting at *offset* of *src_fd* to *dst_fd*.
+
+    Bytes are appended at the current position of *dst_fd*.  Block-aligned
+    ranges on copy-on-write filesystems are reflinked without copying any
+    data; otherwise the copy is done inside the kernel where possible
+    (``copy_file_range`` and then, on Linux, ``sendfile``), falling back to a plain
+    read/write loop on platforms or filesystems that support neither.
+    """
+    end = offset + count
+
+    if _clone_range(src_fd, dst_fd, offset, count):
+        return
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            while offset < end:
+                copied = os.copy_file_range(src_fd, dst_fd, end - offset, offset)
+                if not copied:
+                    break
+                offset += copied
+        except OSError as exc:
+            if exc.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+
+    if offset < end and _SENDFILE_TO_FILE and hasattr(os, "sendfile"):
+        try:
+            while offset < end:
+                sent = os.sendfile(dst_fd, src_fd, offset, end - offset)
+                if not sent:
+                    break
+                offset += sent
+        except OSError as exc:
+            if exc.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+
+    if offset < end:
+        _copy_buffered(src_fd, dst_fd, offset, end - offset)
+
+
+def _clone_range(src_fd: int, dst_fd: int, offset: int, count: int) -> bool:
+    """Try to reflink *count* bytes at *offset* of *src_fd* into *dst_fd*.
+
+    On success the destination shares the source's extents, no data is
+    moved, the position of *dst_fd* is advanced past the range and ``True``
+    is returned.  Returns ``False`` when the platform, filesystem or range
+    alignment does not allow it, leaving *dst_fd* untouched.
+    """
+    if _FICLONERANGE is None or fcntl is None or count <= 0:
+        return False
+    dst_offset = os.lseek(dst_fd, 0, os.SEEK_CUR)
+    arg = struct.pack("qQQQ", src_fd, offset, count, dst_offset)
+    try:
+        fcntl.ioctl(dst_fd, _FICLONERANGE, arg)
+    except OSError:
+        # Unsupported filesystem, cross-device or unaligned range: any real
+        # I/O problem resurfaces in the regular copy that follows.
+        return False
+    os.lseek(dst_fd, dst_offset + count, os.SEEK_SET)
+    return True
+
+
+def _copy_buffered(src_fd: int, dst_fd: int, offset: int, count: int) -> None:
+    """Read/write fallback for :func:`copy_range`.
+
+    Ranges larger than one buffer are copied through a two-buffer pipeline:
+    a reader thread fills one buffer while the calling thread writes out the
+    other, so reading the source overlaps with writing the destination
+    (file I/O releases the GIL).  Buffers are handed back and forth through
+    queues and never copied.
+    """
+    size = min(BUFFER_SIZE, count)
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    with open(src_fd, "rb", buffering=0, closefd=False) as src_fh:
+
+        def read_into(view: memoryview, done: int) -> int:
+            n = src_fh.readinto(view)
+            if not n:
+                raise OSError(
+                    errno.EIO,
+                    f"Unexpected end of file after {offset + done} of "
+                    f"{offset + count} bytes",
+                )
+            return n
+
+        if count <= size:
+            view = memoryview(bytearray(size))
+            done = 0
+            while done < count:
+                n = read_into(view[: count - done], done)
+                write_all(dst_fd, view[:n])
+                done += n
+            return
+
+        free: queue.Queue = queue.Queue()
+        filled: queue.Queue = queue.Queue()
+        for _ in range(2):
+            free.put(bytearray(size))
+        stop = threading.Event()
+
+        def reader() -> None:
+            done = 0
+            try:
+                while done < count and not stop.is_set():
+                    buf = free.get()
+                    if buf is None:
+                        return
+                    n = read_into(memoryview(buf)[: min(size, count - done)], done)
+                    done += n
+                    filled.put((buf, n))
+            except BaseException as exc:  # handed to the writer to re-raise
+                filled.put(exc)
+                return
+            filled.put(None)
+
+        thread = threading.Thread(target=reader, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = filled.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                buf, n = item
+                write_all(dst_fd, memoryview(buf)[:n])
+                free.put(buf)
+        finally:
+            # Unblock the reader if the writer gave up early.
+            stop.set()
+            free.put(None)
+            thread.join()
+
+
+def _map_source(fd: int, size: int) -> Optional[mmap.mmap]:
+    """Map the *size*-byte file behind *fd* read-only, or return ``None``.
+
+    Hashing straight from the mapping lets the page cache feed both the
+    digest and the part writes without first copying every block into a
+    user-space buffer.  Files smaller than :data:`_MMAP_MIN_SIZE`, and files
+    that cannot be mapped, are not.
+    """
+    if size < _MMAP_MIN_SIZE:
+        return None
+    try:
+        mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, OverflowError):
+        # Empty or special files, or a file larger than the address space.
+        return None
+    if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    return mapped
+
+
+class _BackgroundHasher:
+    """Feed blocks to *digest* on a worker thread, in submission order.
+
+    The copy loop writes a block and then submits it, so the digest runs
+    concurrently with the next read and write (hashlib releases the GIL for
+    large updates) instead of adding to them.  At most *depth* blocks are in
+    flight.  A block is a window of a memory map or, when *buf_size* is
+    given, a buffer borrowed from the hasher's own pool.
+    """
+
+    def __init__(self, digest, buf_size: int = 0, depth: int = 3) -> None:
+        self.digest = digest
+        self._slots = threading.Semaphore(depth)
+        self._free: queue.Queue = queue.Queue()
+        if buf_size:
+            for _ in range(depth):
+                self._free.put(bytearray(buf_size))
+        self._pending: queue.Queue = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            view, buf = item
+            if self._error is None:
+                try:
+                    self.digest.update(view)
+                except BaseException as exc:  # re-raised by close()
+                    self._error = exc
+            view.release()
+            if buf is not None:
+                self._free.put(buf)
+            self._slots.release()
+
+    def buffer(self) -> bytearray:
+        """Return a pool buffer that is free to be overwritten."""
+        return self._free.get()
+
+    def release(self, buf: bytearray) -> None:
+        """Hand back a pool buffer without hashing it."""
+        self._free.put(buf)
+
+    def submit(self, view: memoryview, buf: Optional[bytearray] = None) -> None:
+        """Hash *view*, then release it and return *buf* to the pool."""
+        self._slots.acquire()
+        self._pending.put((view, buf))
+
+    def close(self) -> None:
+        """Wait until every submitted block has been hashed and released."""
+        self._pending.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+def _copy_mapped(
+    mapped: mmap.mmap, dst_fd: int, offset: int, count: int, hasher: _BackgroundHasher
+) -> None:
+    """Write *count* bytes at *offset* of *mapped* to *dst_fd* and hash them.
+
+    Works through the range one :data:`BUFFER_SIZE` window at a time; each
+    window is handed to *hasher* once written, so the map must stay open
+    until the hasher is closed.  The following window is requested from
+    disk before the current one is written, so reading ahead overlaps with
+    writing.
+    """
+    end = offset + count
+    with memoryview(mapped) as view:
+        for start in range(offset, end, BUFFER_SIZE):
+            stop = min(start + BUFFER_SIZE, end)
+            if _MADV_WILLNEED is not None and stop < len(mapped):
+                # madvise() wants a page-aligned start; the length is clamped
+                # to the end of the mapping.
+                ahead = stop - stop % mmap.PAGESIZE
+                mapped.madvise(_MADV_WILLNEED, ahead, BUFFER_SIZE)
+            window = view[start:stop]
+            try:
+                write_all(dst_fd, window)
+            except BaseException:
+                # A window left exported would make closing the map fail
+                # and hide this error behind a BufferError.
+                window.release()
+                raise
+            hasher.submit(window)
+
+
+def _copy_hashed(src_fh, dst_fd: int, count: int, hasher: _BackgroundHasher) -> None:
+    """Copy the next *count* bytes of *src_fh* to *dst_fd*, hashing them on the way.
+
+    Buffers are borrowed from *hasher* and submitted to it once written, so
+    no per-read ``bytes`` object is allocated.
+    """
+    while count:
+        buf = hasher.buffer()
+        view = memoryview(buf)
+        n = src_fh.readinto(view[: min(len(view), count)])
+        if not n:
+            hasher.release(buf)
+            raise OSError(errno.EIO, f"Unexpected end of file with {count} bytes left to copy")
+        write_all(dst_fd, view[:n])
+        hasher.submit(view[:n], buf)
+        count -= n
+
+
 # ---------------------------------------------------------------------------
 # Progress callback type
 # ---------------------------------------------------------------------------
@@ -121,6 +542,7 @@ def chop(
     output_dir: Optional[Path] = None,
     progress_cb: ProgressCallback = None,
     verify: bool = True,
+    jobs: int = 1,
 ) -> List[Path]:
     """Split *source* into chunks of at most *chunk_size* bytes.
 
@@ -139,6 +561,12 @@ def chop(
     verify:
         When ``True`` a SHA-256 checksum file is written alongside the parts
         so that :func:`join` can verify integrity.
+    jobs:
+        Number of parts written concurrently.  ``1`` (the default) writes
+        them sequentially and records a single digest of the whole source;
+        larger values keep several writes in flight and record one digest
+        per part instead, hashed by the worker that wrote it.  Both checksum
+        file layouts are ``sha256sum -c`` compatible.
 
     Returns
     -------
@@ -150,17 +578,23 @@ def chop(
     FileNotFoundError
         When *source* does not exist.
     ValueError
-        When *chunk_size* is not positive.
+        When *chunk_size* or *jobs* is not positive.
     IsADirectoryError
         When *source* is a directory.
+    OSError
+        When *source* cannot be examined, e.g. permission is denied.
     """
     source = Path(source)
-    if not source.exists():
+    try:
+        st = os.stat(source)
+    except OSError as exc:
+        if exc.errno not in NOT_FOUND_ERRNOS:
+            raise
         raise FileNotFoundError(
             f"Source file not found: '{source}'\n"
             "Please check the path and try again."
-        )
-    if source.is_dir():
+        ) from None
+    if stat.S_ISDIR(st.st_mode):
         raise IsADirectoryError(
             f"'{source}' is a directory, not a file.\n"
             "file_chopper can only split individual files."
@@ -169,8 +603,10 @@ def chop(
         raise ValueError(
             f"Chunk size must be a positive number of bytes, got {chunk_size}."
         )
+    if jobs <= 0:
+        raise ValueError(f"Number of jobs must be a positive integer, got {jobs}.")
 
-    total_bytes = source.stat().st_size
+    total_bytes = st.st_size
     if total_bytes == 0:
         raise ValueError(
             f"'{source}' is empty (0 bytes). Nothing to split."
@@ -183,31 +619,173 @@ def chop(
 
     cb = progress_cb if callable(progress_cb) else _null_progress
 
-    parts: List[Path] = []
-    index = 1
-    bytes_done = 0
+    num_parts = (total_bytes + chunk_size - 1) // chunk_size
+    parts = [
+        output_dir / (source.name + PART_SUFFIX_TEMPLATE.format(index=index))
+        for index in range(1, num_parts + 1)
+    ]
 
-    with source.open("rb") as src_fh:
-        while True:
-            data = src_fh.read(chunk_size)
-            if not data:
-                break
-            part_path = output_dir / (source.name + PART_SUFFIX_TEMPLATE.format(index=index))
-            with part_path.open("wb") as out_fh:
-                out_fh.write(data)
-            parts.append(part_path)
-            bytes_done += len(data)
-            cb(bytes_done, total_bytes)
-            index += 1
+    if jobs > 1 and num_parts > 1:
+        # SHA-256 cannot be computed out of order, so each worker hashes the
+        # part it writes and the checksum file lists one digest per part.
+        digests = _chop_parallel(
+            source, parts, chunk_size, total_bytes, jobs, cb, verify
+        )
+        entries = [(digest, part.name) for digest, part in zip(digests, parts)]
+    else:
+        checksum = _chop_sequential(source, parts, chunk_size, total_bytes, cb, verify)
+        entries = [(checksum, source.name)]
 
     if verify:
-        checksum = sha256_of_file(source)
         checksum_path = output_dir / (source.name + ".sha256")
-        checksum_path.write_text(f"{checksum}  {source.name}\n", encoding="utf-8")
+        checksum_path.write_text(
+            "".join(f"{digest}  {name}\n" for digest, name in entries),
+            encoding="utf-8",
+        )
 
     return parts
 
 
+def _chop_sequential(
+    source: Path,
+    parts: List[Path],
+    chunk_size: int,
+    total_bytes: int,
+    cb,
+    verify: bool,
+) -> Optional[str]:
+    """Write *parts* one after another; return the source digest if *verify*."""
+    # When a checksum is requested the data has to pass through user space
+    # anyway, so it is hashed (on a background thread) while being copied
+    # instead of re-reading the whole source afterwards.  Without one, parts
+    # are copied in-kernel.
+    hasher = None
+    bytes_done = 0
+
+    with source.open("rb", buffering=0) as src_fh:
+        src_fd = src_fh.fileno()
+        _fadvise(src_fd, _FADV_SEQUENTIAL)
+        mapped = _map_source(src_fd, total_bytes) if verify else None
+        if verify:
+            # Windows of the mapping need no buffers of their own.
+            buf_size = 0 if mapped is not None else min(BUFFER_SIZE, chunk_size)
+            hasher = _BackgroundHasher(hashlib.sha256(), buf_size)
+        try:
+            for part_path in parts:
+                size = min(chunk_size, total_bytes - bytes_done)
+                out_fd = os.open(
+                    part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | O_BINARY, 0o644
+                )
+                try:
+                    _preallocate(out_fd, size)
+                    if hasher is None:
+                        copy_range(src_fd, out_fd, bytes_done, size)
+                    elif mapped is not None:
+                        _copy_mapped(mapped, out_fd, bytes_done, size, hasher)
+                    else:
+                        _copy_hashed(src_fh, out_fd, size, hasher)
+                finally:
+                    os.close(out_fd)
+                # Drop each finished range right away, so a multi-GB source
+                # never occupies more than about a part's worth of cache.
+                _fadvise(src_fd, _FADV_DONTNEED, bytes_done, size)
+                bytes_done += size
+                cb(bytes_done, total_bytes)
+        finally:
+            # The hasher may still hold windows of the mapping.
+            try:
+                if hasher is not None:
+                    hasher.close()
+            finally:
+                if mapped is not None:
+                    mapped.close()
+        # Mapped pages are only dropped once unmapped.
+        _fadvise(src_fd, _FADV_DONTNEED)
+
+    return None if hasher is None else hasher.digest.hexdigest()
+
+
+def _write_part(
+    source: Path, part_path: Path, offset: int, size: int, verify: bool
+) -> Tuple[int, Optional[str]]:
+    """Copy *size* bytes at *offset* of *source* into *part_path*.
+
+    Returns *size* and, when *verify* is set, the SHA-256 of the part.  Each
+    call opens its own descriptor for *source* so that concurrent calls never
+    share a file position.
+    """
+    hexdigest = None
+    with source.open("rb", buffering=0) as src_fh:
+        src_fd = src_fh.fileno()
+        _fadvise(src_fd, _FADV_SEQUENTIAL, offset, size)
+        out_fd = os.open(
+            part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | O_BINARY, 0o644
+        )
+        try:
+            _preallocate(out_fd, size)
+            if verify:
+                hasher = _BackgroundHasher(hashlib.sha256(), min(BUFFER_SIZE, size))
+                src_fh.seek(offset)
+                try:
+                    _copy_hashed(src_fh, out_fd, size, hasher)
+                finally:
+                    hasher.close()
+                hexdigest = hasher.digest.hexdigest()
+            else:
+                copy_range(src_fd, out_fd, offset, size)
+        finally:
+            os.close(out_fd)
+        _fadvise(src_fd, _FADV_DONTNEED, offset, size)
+    return size, hexdigest
+
+
+def _chop_parallel(
+    source: Path,
+    parts: List[Path],
+    chunk_size: int,
+    total_bytes: int,
+    jobs: int,
+    cb,
+    verify: bool,
+) -> List[Optional[str]]:
+    """Write *parts* concurrently using up to *jobs* worker threads.
+
+    Both the kernel copies and :mod:`hashlib` release the GIL, so several
+    parts are copied and hashed at once and threads scale without the
+    pickling overhead of worker processes.  The progress callback is invoked
+    from the calling thread as parts complete.  Returns the per-part digests
+    in part order (``None`` entries when *verify* is off).
+    """
+    # Imported here: concurrent.futures pulls in logging and friends, which
+    # sequential runs (the default) and plain CLI invocations never need.
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    bytes_done = 0
+    digests: List[Optional[str]] = [None] * len(parts)
+    with ThreadPoolExecutor(max_workers=min(jobs, len(parts))) as pool:
+        futures = {
+            pool.submit(
+                _write_part,
+                source,
+                part_path,
+                i * chunk_size,
+                min(chunk_size, total_bytes - i * chunk_size),
+                verify,
+            ): i
+            for i, part_path in enumerate(parts)
+        }
+        try:
+            for future in as_completed(futures):
+                size, digests[futures[future]] = future.result()
+                bytes_done += size
+                cb(bytes_done, total_bytes)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return digests
+
+
 # ---------------------------------------------------------------------------
 # Join
 # ---------------------------------------------------------------------------
@@ -218,6 +796,8 @@ def join(
     output: Optional[Path] = None,
     progress_cb: ProgressCallback = None,
     verify: bool = True,
+    jobs: int = 1,
+    sizes: Optional[List[int]] = None,
 ) -> Path:
     """Reassemble *parts* into the original file.
 
@@ -238,6 +818,14 @@ def join(
     verify:
         When ``True`` the SHA-256 checksum file (if present) is used to
         verify that the reassembled file matches the original.
+    jobs:
+        Number of worker threads used to verify a checksum file that lists
+        one digest per part (see :func:`chop`).  Whole-file digests are
+        always checked in a single pass.
+    sizes:
+        Sizes of *parts* in bytes, when the caller has already measured them;
+        saves stat'ing every part again.  Exactly this many bytes are copied
+        from each part.
 
     Returns
     -------
@@ -249,8 +837,11 @@ def join(
     FileNotFoundError
         When any of the supplied *parts* do not exist.
     ValueError
-        When *parts* is empty.
+        When *parts* is empty, *jobs* is not positive, *sizes* does not match
+        *parts*, or verification fails.
     """
+    if jobs <= 0:
+        raise ValueError(f"Number of jobs must be a positive integer, got {jobs}.")
     if not parts:
         raise ValueError(
             "No part files supplied.  "
@@ -258,49 +849,66 @@ def join(
         )
 
     parts = [Path(p) for p in parts]
-    for part in parts:
-        if not part.exists():
-            raise FileNotFoundError(
-                f"Part file not found: '{part}'\n"
-                "Make sure all part files are present before joining."
-            )
+    if sizes is None:
+        sizes = []
+        for part in parts:
+            # A single stat both checks for existence and yields the size.
+            try:
+                sizes.append(os.stat(part).st_size)
+            except FileNotFoundError:
+                raise _part_not_found(part) from None
+    elif len(sizes) != len(parts):
+        raise ValueError(f"Got {len(sizes)} sizes for {len(parts)} part files.")
 
-    total_bytes = sum(p.stat().st_size for p in parts)
+    total_bytes = sum(sizes)
     cb = progress_cb if callable(progress_cb) else _null_progress
 
     if output is None:
         first = parts[0]
-        m = PART_PATTERN.match(first.name)
-        if m:
-            base_name = m.group(1)
-        else:
-            base_name = first.stem
+        parsed = match_part(first.name)
+        base_name = parsed[0] if parsed else first.stem
         output = first.parent / base_name
 
     output = Path(output)
     output.parent.mkdir(parents=True, exist_ok=True)
 
     bytes_done = 0
-    with output.open("wb") as out_fh:
-        for part in parts:
-            with part.open("rb") as part_fh:
-                while True:
-                    data = part_fh.read(BUFFER_SIZE)
-                    if not data:
-                        break
-                    out_fh.write(data)
-                    bytes_done += len(data)
-                    cb(bytes_done, total_bytes)
+    out_fd = os.open(output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | O_BINARY, 0o644)
+    try:
+        _preallocate(out_fd, total_bytes)
+        for part, size in zip(parts, sizes):
+            try:
+                part_fd = os.open(part, os.O_RDONLY | O_BINARY)
+            except FileNotFoundError:
+                raise _part_not_found(part) from None
+            try:
+                _fadvise(part_fd, _FADV_SEQUENTIAL)
+                copy_range(part_fd, out_fd, 0, size)
+                _fadvise(part_fd, _FADV_DONTNEED)
+            finally:
+                os.close(part_fd)
+            bytes_done += size
+            cb(bytes_done, total_bytes)
+    finally:
+        os.close(out_fd)
 
     if verify:
         # Locate the checksum file using the base name derived from the part
         # file names (e.g. "sample.bin.sha256"), NOT from the output file name,
         # because the caller may write the output to a different name.
-        m = PART_PATTERN.match(parts[0].name)
-        checksum_name = (m.group(1) if m else output.name) + ".sha256"
-        checksum_path = parts[0].parent / checksum_name
+        parsed = match_part(parts[0].name)
+        base_name = parsed[0] if parsed else output.name
+        checksum_path = parts[0].parent / (base_name + ".sha256")
         if checksum_path.exists():
-            expected_line = checksum_path.read_text(encoding="utf-8").split()[0]
+            entries = _read_checksum_file(checksum_path)
+            # chop() only writes per-part digests for two or more parts, so a
+            # single entry is a whole-file digest whatever its name (the
+            # source may itself be called "x.part0001", and parts and
+            # checksum file may have been renamed together).
+            if len(entries) > 1:
+                _verify_parts(output, parts, sizes, entries, jobs)
+                return output
+            expected_line = entries[0][0] if entries else ""
             actual = sha256_of_file(output)
             if actual != expected_line:
                 output.unlink(missing_ok=True)
@@ -315,6 +923,104 @@ def join(
     return output
 
 
+def _part_not_found(part: Path) -> FileNotFoundError:
+    """Build the error raised when a part file to be joined is missing."""
+    return FileNotFoundError(
+        f"Part file not found: '{part}'\n"
+        "Make sure all part files are present before joining."
+    )
+
+
+def _read_checksum_file(path: Path) -> List[Tuple[str, str]]:
+    """Parse a ``sha256sum``-style file into ``(digest, name)`` pairs."""
+    entries = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        fields = line.split(None, 1)
+        if fields:
+            name = fields[1].lstrip("*") if len(fields) > 1 else ""
+            entries.append((fields[0], name))
+    return entries
+
+
+def _sha256_of_range(path: Path, offset: int, size: int) -> str:
+    """Return the SHA-256 hex digest of *size* bytes at *offset* of *path*."""
+    digest = hashlib.sha256()
+    buf = bytearray(min(_HASH_BUFFER_SIZE, size) or 1)
+    view = memoryview(buf)
+    with Path(path).open("rb", buffering=0) as fh:
+        fh.seek(offset)
+        remaining = size
+        while remaining:
+            n = fh.readinto(view[: min(len(buf), remaining)])
+            if not n:
+                break
+            digest.update(view[:n])
+            remaining -= n
+    return digest.hexdigest()
+
+
+def _verify_parts(
+    output: Path,
+    parts: List[Path],
+    sizes: List[int],
+    entries: List[Tuple[str, str]],
+    jobs: int,
+) -> None:
+    """Check each part's range of *output* against a per-part checksum file.
+
+    The reassembled file is removed and :class:`ValueError` raised when a
+    listed part was not joined, an unlisted part was, a part was joined twice
+    or out of the listed order, or any range differs.
+    """
+    expected = {name: digest for digest, name in entries}
+    names = [part.name for part in parts]
+    joined = set(names)
+    missing = [name for name in expected if name not in joined]
+    unlisted = [name for name in names if name not in expected]
+    if missing or unlisted:
+        output.unlink(missing_ok=True)
+        raise ValueError(
+            "Checksum mismatch!\n"
+            f"  Missing parts  : {', '.join(missing) or '-'}\n"
+            f"  Unlisted parts : {', '.join(unlisted) or '-'}\n"
+            "The reassembled file has been removed.  "
+            "Ensure all part files are present and retry."
+        )
+    # Every digest can match while the output is still wrong if parts were
+    # repeated or swapped, so the joined order must be the listed one.
+    listed = [name for _, name in entries]
+    if names != listed:
+        output.unlink(missing_ok=True)
+        raise ValueError(
+            "Checksum mismatch!\n"
+            f"  Expected order : {', '.join(listed)}\n"
+            f"  Joined order   : {', '.join(names)}\n"
+            "The reassembled file has been removed.  "
+            "Join each part exactly once, in order, and retry."
+        )
+
+    offsets = [0, *accumulate(sizes[:-1])]
+    workers = min(jobs, len(parts))
+    if workers == 1:
+        actual = list(map(_sha256_of_range, [output] * len(parts), offsets, sizes))
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            actual = list(
+                pool.map(_sha256_of_range, [output] * len(parts), offsets, sizes)
+            )
+    corrupt = [name for name, got in zip(names, actual) if got != expected[name]]
+    if corrupt:
+        output.unlink(missing_ok=True)
+        raise ValueError(
+            "Checksum mismatch!\n"
+            f"  Corrupt parts : {', '.join(corrupt)}\n"
+            "The reassembled file has been removed.  "
+            "Ensure all part files are intact and retry."
+        )
+
+
 # ---------------------------------------------------------------------------
 # Discovery helpers
 # ---------------------------------------------------------------------------
@@ -341,9 +1047,19 @@ def find_parts(directory: Path, base_name: str) -> List[Path]:
         When no matching part files are found.
     """
     directory = Path(directory)
-    pattern = f"{base_name}.part*"
-    candidates = sorted(directory.glob(pattern))
-    parts = [p for p in candidates if PART_PATTERN.match(p.name)]
+    found = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                parsed = match_part(entry.name)
+                if parsed is not None and parsed[0] == base_name:
+                    found.append((parsed[1], entry.path))
+    except OSError:
+        # A directory that is missing, not a directory or unreadable yields
+        # no parts.
+        pass
+    found.sort()
+    parts = [Path(path) for _, path in found]
     if not parts:
         raise FileNotFoundError(
             f"No part files found for '{base_name}' in '{directory}'.\n"
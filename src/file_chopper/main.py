@@ -7,60 +7,193 @@ Entry point: ``file_chopper`` (defined in pyproject.toml console_scripts).
 from __future__ import annotations
 
 import argparse
+import functools
+import os
+import stat
 import sys
-import textwrap
+import time
 from pathlib import Path
 from typing import List, Optional
 
 from file_chopper import __version__
 from file_chopper.chopper import (
+    NOT_FOUND_ERRNOS,
     chop,
     find_parts,
     format_size,
     join,
+    match_part,
     parse_size,
 )
 from file_chopper.segmenter import (
     SegmentStatus,
     segment_document,
+    segment_folder,
 )
 
+#: Dry runs list every part up to this many parts, and elide the middle beyond.
+_DRY_RUN_FULL_LISTING = 20
+
+
 # ---------------------------------------------------------------------------
 # Optional progress bar (tqdm).  Falls back gracefully if not installed.
 # ---------------------------------------------------------------------------
 
-try:
-    from tqdm import tqdm as _tqdm  # type: ignore[import-untyped]
-
-    def _make_progress_cb(description: str, total: int):  # type: ignore[return]
-        bar = _tqdm(
-            total=total,
-            unit="B",
-            unit_scale=True,
-            unit_divisor=1024,
-            desc=description,
-            dynamic_ncols=True,
-        )
-        _prev = [0]
+# tqdm is imported only when a bar is actually shown, so that --help,
+# --version, --quiet and argument errors do not pay for loading it.
+
+
+def _make_progress_cb(description: str, total: int):
+    try:
+        from tqdm import tqdm as _tqdm  # type: ignore[import-untyped]
+    except ImportError:  # pragma: no cover
+        return _make_text_progress_cb(description, total)
+
+    bar = _tqdm(
+        total=total,
+        unit="B",
+        unit_scale=True,
+        unit_divisor=1024,
+        desc=description,
+        dynamic_ncols=True,
+        mininterval=0.25,
+        maxinterval=1.0,
+        miniters=0,
+    )
+    # Coalesce updates: redrawing the bar for every small part would
+    # dominate the run time on fast storage.
+    step = max(total // 1000, 1 << 20)
+    _prev = [0]
+
+    def _cb(done: int, _total: int) -> None:
+        if done - _prev[0] < step and done < _total:
+            return
+        bar.update(done - _prev[0])
+        _prev[0] = done
+        if done >= _total:
+            bar.close()
+
+    return _cb
+
+
+def _make_text_progress_cb(description: str, total: int):  # pragma: no cover
+    # Redrawn at most every 0.1 s: flushing the terminal on every update can
+    # cost more than the copy itself.
+    prefix = f"\r{description}: "
+    _last = [float("-inf")]
+
+    def _cb(done: int, _total: int) -> None:
+        finished = done >= _total
+        now = time.monotonic()
+        if now - _last[0] < 0.1 and not finished:
+            return
+        _last[0] = now
+        pct = done / _total * 100 if _total else 0
+        stream = sys.stdout
+        stream.write(f"{prefix}{pct:.1f}%\n" if finished else f"{prefix}{pct:.1f}%")
+        stream.flush()
+
+    return _cb
+
+
+# ---------------------------------------------------------------------------
+# Help texts (kept flush-left so argparse can use them as-is)
+# ---------------------------------------------------------------------------
 
-        def _cb(done: int, _total: int) -> None:
-            bar.update(done - _prev[0])
-            _prev[0] = done
-            if done >= _total:
-                bar.close()
+_MAIN_DESCRIPTION = """\
+file_chopper — Split large files into smaller pieces and rejoin them.
 
-        return _cb
+Common workflows
+────────────────
+  Split a 2 GB ISO into 700 MB pieces:
+      file_chopper chop big_file.iso --size 700MB
 
-except ImportError:  # pragma: no cover
+  Rejoin the pieces:
+      file_chopper join big_file.iso.part0001
 
-    def _make_progress_cb(description: str, total: int):  # type: ignore[return]
-        def _cb(done: int, _total: int) -> None:
-            pct = done / _total * 100 if _total else 0
-            print(f"\r{description}: {pct:.1f}%", end="", flush=True)
-            if done >= _total:
-                print()
+  Segment documents for Fess:
+      file_chopper segment /data/docs --output-dir /output
+
+  List how many parts a file will produce:
+      file_chopper chop big_file.iso --size 700MB --dry-run
+"""
+
+_MAIN_EPILOG = """\
+Size units
+──────────
+  B   bytes
+  K / KB   kibibytes  (1 024 B)
+  M / MB   mebibytes  (1 024 KB)
+  G / GB   gibibytes  (1 024 MB)
+  T / TB   tebibytes  (1 024 GB)
+
+Exit codes
+──────────
+  0   success
+  1   completed with errors (at least one file failed)
+  2   configuration/argument error
+  3   missing Python dependency
+"""
+
+_CHOP_DESCRIPTION = """\
+Split FILE into chunks of at most SIZE bytes.
+
+Each chunk is written as FILE.partNNNN (e.g. movie.mkv.part0001).
+A SHA-256 checksum file (FILE.sha256) is also created so that
+'file_chopper join' can verify integrity after reassembly.
+
+Examples
+────────
+  Split into 100 MB pieces (output next to the source file):
+      file_chopper chop archive.tar.gz --size 100MB
+
+  Split into 1 GB pieces and save to /tmp:
+      file_chopper chop backup.tar --size 1G --output-dir /tmp
+
+  Preview without writing anything:
+      file_chopper chop big.iso --size 700MB --dry-run
+"""
 
-        return _cb
+_JOIN_DESCRIPTION = """\
+Reassemble piece files produced by 'file_chopper chop'.
+
+You can supply either:
+  • A single .partNNNN file — all sibling parts are found automatically.
+  • A directory           — the directory is searched for .partNNNN files.
+  • An explicit list of .partNNNN files in the desired order.
+
+Examples
+────────
+  Auto-discover parts next to the first part file:
+      file_chopper join archive.tar.gz.part0001
+
+  Auto-discover parts in a directory:
+      file_chopper join /tmp/parts/ --base archive.tar.gz
+
+  Write output to a specific location:
+      file_chopper join archive.tar.gz.part0001 --output /data/archive.tar.gz
+"""
+
+_SEGMENT_DESCRIPTION = """\
+Split large source documents into smaller child documents and
+prepare an output folder structure suitable for a Fess filesystem crawl.
+
+Supported formats: .pdf .txt .csv .md .html .htm .docx .pptx .xlsx
+                   .odt .odp .ods .rtf
+
+Out-of-scope formats (.doc .ppt .xls):
+  - If no split is required: copied unchanged (exit 0).
+  - If split is required:    marked as error (exit 1).
+
+Examples
+────────
+  Segment all documents in /data/docs into /output:
+      file_chopper segment /data/docs --output-dir /output
+
+  Segment a single file with custom limits:
+      file_chopper segment report.docx --output-dir /output \\
+          --max-size 5MB --max-chars 50000
+"""
 
 
 # ---------------------------------------------------------------------------
@@ -68,47 +201,15 @@ except ImportError:  # pragma: no cover
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
+    # Built once per process: parse_args() does not modify the parser, so
+    # repeated main() calls (tests, embedding applications) can share it.
     parser = argparse.ArgumentParser(
         prog="file_chopper",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        description=textwrap.dedent(
-            """\
-            file_chopper — Split large files into smaller pieces and rejoin them.
-
-            Common workflows
-            ────────────────
-              Split a 2 GB ISO into 700 MB pieces:
-                  file_chopper chop big_file.iso --size 700MB
-
-              Rejoin the pieces:
-                  file_chopper join big_file.iso.part0001
-
-              Segment documents for Fess:
-                  file_chopper segment /data/docs --output-dir /output
-
-              List how many parts a file will produce:
-                  file_chopper chop big_file.iso --size 700MB --dry-run
-            """
-        ),
-        epilog=textwrap.dedent(
-            """\
-            Size units
-            ──────────
-              B   bytes
-              K / KB   kibibytes  (1 024 B)
-              M / MB   mebibytes  (1 024 KB)
-              G / GB   gibibytes  (1 024 MB)
-              T / TB   tebibytes  (1 024 GB)
-
-            Exit codes
-            ──────────
-              0   success
-              1   completed with errors (at least one file failed)
-              2   configuration/argument error
-              3   missing Python dependency
-            """
-        ),
+        description=_MAIN_DESCRIPTION,
+        epilog=_MAIN_EPILOG,
     )
     parser.add_argument(
         "--version",
@@ -124,26 +225,7 @@ def _build_parser() -> argparse.ArgumentParser:
         "chop",
         help="Split a file into smaller pieces.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        description=textwrap.dedent(
-            """\
-            Split FILE into chunks of at most SIZE bytes.
-
-            Each chunk is written as FILE.partNNNN (e.g. movie.mkv.part0001).
-            A SHA-256 checksum file (FILE.sha256) is also created so that
-            'file_chopper join' can verify integrity after reassembly.
-
-            Examples
-            ────────
-              Split into 100 MB pieces (output next to the source file):
-                  file_chopper chop archive.tar.gz --size 100MB
-
-              Split into 1 GB pieces and save to /tmp:
-                  file_chopper chop backup.tar --size 1G --output-dir /tmp
-
-              Preview without writing anything:
-                  file_chopper chop big.iso --size 700MB --dry-run
-            """
-        ),
+        description=_CHOP_DESCRIPTION,
     )
     chop_parser.add_argument(
         "file",
@@ -180,6 +262,19 @@ def _build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Show what would be done without writing any files.",
     )
+    chop_parser.add_argument(
+        "--jobs",
+        "-j",
+        "--parallel-chunks",
+        dest="jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Write and hash N pieces at a time (default: 1).  With N > 1 the "
+            "checksum file lists one SHA-256 per piece."
+        ),
+    )
     chop_parser.add_argument(
         "--quiet",
         "-q",
@@ -193,27 +288,7 @@ def _build_parser() -> argparse.ArgumentParser:
         "join",
         help="Reassemble pieces back into the original file.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        description=textwrap.dedent(
-            """\
-            Reassemble piece files produced by 'file_chopper chop'.
-
-            You can supply either:
-              • A single .partNNNN file — all sibling parts are found automatically.
-              • A directory           — the directory is searched for .partNNNN files.
-              • An explicit list of .partNNNN files in the desired order.
-
-            Examples
-            ────────
-              Auto-discover parts next to the first part file:
-                  file_chopper join archive.tar.gz.part0001
-
-              Auto-discover parts in a directory:
-                  file_chopper join /tmp/parts/ --base archive.tar.gz
-
-              Write output to a specific location:
-                  file_chopper join archive.tar.gz.part0001 --output /data/archive.tar.gz
-            """
-        ),
+        description=_JOIN_DESCRIPTION,
     )
     join_parser.add_argument(
         "parts",
@@ -250,6 +325,16 @@ def _build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Skip SHA-256 integrity verification after reassembly.",
     )
+    join_parser.add_argument(
+        "--jobs",
+        "-j",
+        "--parallel-chunks",
+        dest="jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Verify N pieces at a time when the checksum file lists one per piece (default: 1).",
+    )
     join_parser.add_argument(
         "--quiet",
         "-q",
@@ -263,28 +348,7 @@ def _build_parser() -> argparse.ArgumentParser:
         "segment",
         help="Segment large documents for Fess filesystem crawl.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        description=textwrap.dedent(
-            """\
-            Split large source documents into smaller child documents and
-            prepare an output folder structure suitable for a Fess filesystem crawl.
-
-            Supported formats: .pdf .txt .csv .md .html .htm .docx .pptx .xlsx
-                               .odt .odp .ods .rtf
-
-            Out-of-scope formats (.doc .ppt .xls):
-              - If no split is required: copied unchanged (exit 0).
-              - If split is required:    marked as error (exit 1).
-
-            Examples
-            ────────
-              Segment all documents in /data/docs into /output:
-                  file_chopper segment /data/docs --output-dir /output
-
-              Segment a single file with custom limits:
-                  file_chopper segment report.docx --output-dir /output \\
-                      --max-size 5MB --max-chars 50000
-            """
-        ),
+        description=_SEGMENT_DESCRIPTION,
     )
     seg_parser.add_argument(
         "source",
@@ -323,6 +387,17 @@ def _build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Stop processing after the first error.",
     )
+    seg_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Process N documents of a directory at a time, each in its own "
+            "worker process (default: 1)."
+        ),
+    )
     seg_parser.add_argument(
         "--quiet",
         "-q",
@@ -350,14 +425,24 @@ def _cmd_chop(args: argparse.Namespace) -> int:
 
     output_dir = Path(args.output_dir) if args.output_dir else None
 
-    if not source.exists():
+    if args.jobs <= 0:
+        print("Error: --jobs must be a positive integer.", file=sys.stderr)
+        return 1
+
+    # One stat answers "exists?", "directory?" and "how big?".
+    try:
+        st = os.stat(source)
+    except OSError as exc:
+        if exc.errno not in NOT_FOUND_ERRNOS:
+            print(f"Error: Cannot read file '{source}': {exc.strerror}", file=sys.stderr)
+            return 1
         print(
             f"Error: File not found: '{source}'\n"
             "Please check the path and try again.",
             file=sys.stderr,
         )
         return 1
-    if source.is_dir():
+    if stat.S_ISDIR(st.st_mode):
         print(
             f"Error: '{source}' is a directory, not a file.\n"
             "file_chopper can only split individual files.",
@@ -365,27 +450,48 @@ def _cmd_chop(args: argparse.Namespace) -> int:
         )
         return 1
 
-    file_size = source.stat().st_size
+    file_size = st.st_size
     if file_size == 0:
         print(f"Error: '{source}' is empty (0 bytes). Nothing to split.", file=sys.stderr)
         return 1
 
-    num_parts = (file_size + chunk_size - 1) // chunk_size
+    num_parts, last_size = divmod(file_size, chunk_size)
+    if last_size:
+        num_parts += 1
+    else:
+        last_size = chunk_size
     dest = output_dir or source.parent
+    # Parts come in at most two sizes, so format each only once.
+    full_size_str = format_size(chunk_size)
+    last_size_str = format_size(last_size)
 
     print(
         f"  Source     : {source}  ({format_size(file_size)})\n"
-        f"  Chunk size : {format_size(chunk_size)}\n"
+        f"  Chunk size : {full_size_str}\n"
         f"  Parts      : {num_parts}\n"
         f"  Output dir : {dest}"
     )
 
     if args.dry_run:
         print("\nDry-run mode — no files written.")
-        for i in range(1, num_parts + 1):
-            part_name = source.name + f".part{i:04d}"
-            size = chunk_size if i < num_parts else file_size - (num_parts - 1) * chunk_size
-            print(f"  Would create: {dest / part_name}  ({format_size(size)})")
+
+        # Part paths differ only in the index, so build the rest once.
+        part_prefix = f"{dest / source.name}.part"
+
+        def would_create(i: int) -> str:
+            size_str = full_size_str if i < num_parts else last_size_str
+            return f"  Would create: {part_prefix}{i:04d}  ({size_str})"
+
+        if num_parts > _DRY_RUN_FULL_LISTING:
+            # Elide the middle of long listings: the parts only differ by index.
+            lines = [would_create(i) for i in range(1, 4)]
+            lines.append(
+                f"  ... {num_parts - 6} more parts of {full_size_str} each ..."
+            )
+            lines.extend(would_create(i) for i in range(num_parts - 2, num_parts + 1))
+        else:
+            lines = [would_create(i) for i in range(1, num_parts + 1)]
+        print("\n".join(lines))
         return 0
 
     progress_cb = (
@@ -401,27 +507,36 @@ def _cmd_chop(args: argparse.Namespace) -> int:
             output_dir=output_dir,
             progress_cb=progress_cb,
             verify=not args.no_verify,
+            jobs=args.jobs,
         )
     except (FileNotFoundError, IsADirectoryError, ValueError, OSError) as exc:
         print(f"\nError: {exc}", file=sys.stderr)
         return 1
 
     if not args.quiet:
-        print(f"\nCreated {len(parts)} part(s):")
-        for p in parts:
-            print(f"  {p}  ({format_size(p.stat().st_size)})")
+        # Every part but the last is exactly chunk_size bytes, so the sizes
+        # are known without stat()ing each part again.
+        lines = [f"\nCreated {len(parts)} part(s):"]
+        lines.extend(f"  {p}  ({full_size_str})" for p in parts[:-1])
+        lines.append(f"  {parts[-1]}  ({last_size_str})")
         if not args.no_verify:
             checksum_path = (output_dir or source.parent) / (source.name + ".sha256")
-            print(f"  {checksum_path}  (SHA-256 checksum)")
+            lines.append(f"  {checksum_path}  (SHA-256 checksum)")
+        print("\n".join(lines))
 
     return 0
 
 
 def _cmd_join(args: argparse.Namespace) -> int:
     raw_parts: List[str] = args.parts
+    if args.jobs <= 0:
+        print("Error: --jobs must be a positive integer.", file=sys.stderr)
+        return 1
 
-    # Resolve the list of part files
-    if len(raw_parts) == 1 and Path(raw_parts[0]).is_dir():
+    # Resolve the list of part files.  Explicit part lists stay plain strings
+    # (join() converts them once), so that long shell globs do not pay for
+    # building Path objects here.
+    if len(raw_parts) == 1 and os.path.isdir(raw_parts[0]):
         # User passed a directory
         directory = Path(raw_parts[0])
         if not args.base:
@@ -439,18 +554,12 @@ def _cmd_join(args: argparse.Namespace) -> int:
     else:
         # One or more explicit part files (or the first .partNNNN from which
         # we discover siblings automatically)
-        if (
-            len(raw_parts) == 1
-            and not Path(raw_parts[0]).is_dir()
-            and ".part" in raw_parts[0]
-        ):
+        if len(raw_parts) == 1 and ".part" in raw_parts[0]:
             first = Path(raw_parts[0])
             # Extract base name and discover all sibling parts
-            from file_chopper.chopper import PART_PATTERN
-
-            m = PART_PATTERN.match(first.name)
-            if m:
-                base_name = m.group(1)
+            parsed = match_part(first.name)
+            if parsed:
+                base_name = parsed[0]
                 try:
                     part_paths = find_parts(first.parent, base_name)
                 except FileNotFoundError as exc:
@@ -459,20 +568,31 @@ def _cmd_join(args: argparse.Namespace) -> int:
             else:
                 part_paths = [first]
         else:
-            part_paths = [Path(p) for p in raw_parts]
+            part_paths = raw_parts
 
     output = Path(args.output) if args.output else None
 
-    total_bytes = 0
+    sizes = []
     for p in part_paths:
-        if not p.exists():
+        # A single stat both checks for existence and yields the size; join()
+        # reuses the sizes instead of stat'ing every part again.
+        try:
+            st = os.stat(p)
+        except OSError as exc:
+            if exc.errno not in NOT_FOUND_ERRNOS:
+                print(f"Error: Cannot read part file '{p}': {exc.strerror}", file=sys.stderr)
+                return 1
             print(
                 f"Error: Part file not found: '{p}'\n"
                 "Make sure all part files are present before joining.",
                 file=sys.stderr,
             )
             return 1
-        total_bytes += p.stat().st_size
+        if not stat.S_ISREG(st.st_mode):
+            print(f"Error: Part is not a regular file: '{p}'", file=sys.stderr)
+            return 1
+        sizes.append(st.st_size)
+    total_bytes = sum(sizes)
 
     if not args.quiet:
         print(
@@ -493,6 +613,8 @@ def _cmd_join(args: argparse.Namespace) -> int:
             output=output,
             progress_cb=progress_cb,
             verify=not args.no_verify,
+            jobs=args.jobs,
+            sizes=sizes,
         )
     except FileNotFoundError as exc:
         print(f"\nError: {exc}", file=sys.stderr)
@@ -507,11 +629,10 @@ def _cmd_join(args: argparse.Namespace) -> int:
     if not args.quiet:
         print(f"\nReassembled file: {out_path}  ({format_size(out_path.stat().st_size)})")
         if not args.no_verify:
-            from file_chopper.chopper import PART_PATTERN as _PP
-
-            m = _PP.match(part_paths[0].name)
-            checksum_name = (m.group(1) if m else out_path.name) + ".sha256"
-            checksum_path = part_paths[0].parent / checksum_name
+            first_part = Path(part_paths[0])
+            parsed = match_part(first_part.name)
+            checksum_name = (parsed[0] if parsed else out_path.name) + ".sha256"
+            checksum_path = first_part.parent / checksum_name
             if checksum_path.exists():
                 print("  ✓ Integrity check passed (SHA-256)")
             else:
@@ -538,7 +659,16 @@ def _cmd_segment(args: argparse.Namespace) -> int:
         print("Error: --max-chars must be a positive integer.", file=sys.stderr)
         return 2
 
-    if not source.exists():
+    if args.jobs <= 0:
+        print("Error: --jobs must be a positive integer.", file=sys.stderr)
+        return 2
+
+    try:
+        source_st = os.stat(source)
+    except OSError as exc:
+        if exc.errno not in NOT_FOUND_ERRNOS:
+            print(f"Error: Cannot read source '{source}': {exc.strerror}", file=sys.stderr)
+            return 2
         print(
             f"Error: Source not found: '{source}'\n"
             "Please check the path and try again.",
@@ -548,15 +678,14 @@ def _cmd_segment(args: argparse.Namespace) -> int:
 
     output_dir = Path(args.output_dir)
 
-    if source.is_dir():
-        from file_chopper.segmenter import segment_folder
-
+    if stat.S_ISDIR(source_st.st_mode):
         results = segment_folder(
             input_dir=source,
             output_dir=output_dir,
             max_child_bytes=max_child_bytes,
             max_child_text_chars=args.max_chars,
             fail_fast=args.fail_fast,
+            jobs=args.jobs,
         )
     else:
         result = segment_document(
@@ -564,6 +693,7 @@ def _cmd_segment(args: argparse.Namespace) -> int:
             output_dir=output_dir,
             max_child_bytes=max_child_bytes,
             max_child_text_chars=args.max_chars,
+            size=source_st.st_size,
         )
         results = [result]
 
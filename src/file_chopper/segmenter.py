@@ -7,11 +7,22 @@ prepares an output folder structure suitable for a Fess filesystem crawl.
 
 from __future__ import annotations
 
+import codecs
+import datetime
+import functools
 import html
+import io
+import mmap
+import os
 import shutil
+import stat
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import repeat
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from file_chopper.chopper import O_BINARY, copy_range, write_all
 
 # ---------------------------------------------------------------------------
 # Format classification
@@ -66,11 +77,76 @@ class SegmentResult:
 # ---------------------------------------------------------------------------
 
 
+#: Bytes read per block when streaming plain-text files.
+_PLAIN_TEXT_BLOCK = 1 << 20
+
+
+def _plain_text_decoder() -> io.IncrementalNewlineDecoder:
+    """Return a UTF-8 decoder that translates newlines like text-mode files."""
+    utf8 = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    return io.IncrementalNewlineDecoder(utf8, translate=True)
+
+
 def _extract_text_plain(path: Path) -> str:
-    return path.read_text(encoding="utf-8", errors="replace")
+    # Decode straight from a read-only mapping with the stateless UTF-8
+    # codec.  read_text() and the incremental decoders both build a bytes
+    # copy of the whole file first, which doubles peak memory.
+    with path.open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            text, _ = codecs.utf_8_decode(mapped, "replace", True)
+    if "\r" in text:
+        # Translate newlines the way text-mode files do.
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _iter_text_plain(path: Path) -> Iterator[str]:
+    # Decoding binary blocks is about a third faster than reading through a
+    # text-mode file object, with the same result.
+    decoder = _plain_text_decoder()
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(_PLAIN_TEXT_BLOCK), b""):
+            text = decoder.decode(block)
+            if text:
+                yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
 
 
 def _extract_html_text(path: Path) -> str:
+    raw = path.read_text(encoding="utf-8", errors="replace")
+    try:
+        # Optional: selectolax's compiled Lexbor parser is roughly ten times
+        # faster than html.parser on large pages.
+        from selectolax.lexbor import LexborHTMLParser  # type: ignore[import-untyped]
+    except ImportError:
+        return _html_text_stdlib(raw)
+
+    tree = LexborHTMLParser(raw)
+    for node in tree.css("script, style"):
+        node.decompose()
+    if tree.root is None:
+        return ""
+    # Unescaped once more, exactly like the html.parser result below.
+    return html.unescape(tree.root.text(deep=True, separator=""))
+
+
+def _html_text_stdlib(raw: str) -> str:
+    extractor = _html_extractor_class()()
+    extractor.feed(raw)
+    return html.unescape("".join(extractor._chunks))
+
+
+@functools.lru_cache(maxsize=None)
+def _html_extractor_class() -> type:
+    """Return the html.parser based text extractor class.
+
+    It is defined on first use and then reused, so html.parser is only
+    imported when an HTML file is actually converted without selectolax.
+    """
     from html.parser import HTMLParser
 
     class _Extractor(HTMLParser):
@@ -91,13 +167,24 @@ def _extract_html_text(path: Path) -> str:
             if not self._skip:
                 self._chunks.append(data)
 
-    raw = path.read_text(encoding="utf-8", errors="replace")
-    extractor = _Extractor()
-    extractor.feed(raw)
-    return html.unescape("".join(extractor._chunks))
+    return _Extractor
 
 
 def _extract_pdf_text(path: Path) -> str:
+    return "\n".join(_iter_pdf_text(path))
+
+
+def _iter_pdf_text(path: Path) -> Iterator[str]:
+    try:
+        # Optional: pypdfium2 wraps the PDFium C++ library and extracts text
+        # several times faster than pypdf.
+        import pypdfium2  # type: ignore[import-untyped]
+    except ImportError:
+        pass
+    else:
+        yield from _iter_pdf_text_pdfium(pypdfium2, path)
+        return
+
     try:
         import pypdf  # type: ignore[import-untyped]
     except ImportError as exc:
@@ -107,14 +194,33 @@ def _extract_pdf_text(path: Path) -> str:
         ) from exc
 
     reader = pypdf.PdfReader(str(path))
-    parts = []
     for page in reader.pages:
-        text = page.extract_text() or ""
-        parts.append(text)
-    return "\n".join(parts)
+        yield page.extract_text() or ""
+
+
+def _iter_pdf_text_pdfium(pdfium, path: Path) -> Iterator[str]:
+    pdf = pdfium.PdfDocument(str(path))
+    try:
+        for index in range(len(pdf)):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            try:
+                text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+            # PDFium ends lines with CRLF; pypdf (and every other extractor)
+            # uses LF.
+            yield text.replace("\r\n", "\n")
+    finally:
+        pdf.close()
 
 
 def _extract_docx_text(path: Path) -> str:
+    return "\n".join(_iter_docx_text(path))
+
+
+def _iter_docx_text(path: Path) -> Iterator[str]:
     try:
         import docx  # type: ignore[import-untyped]
     except ImportError as exc:
@@ -124,10 +230,15 @@ def _extract_docx_text(path: Path) -> str:
         ) from exc
 
     doc = docx.Document(str(path))
-    return "\n".join(para.text for para in doc.paragraphs)
+    for para in doc.paragraphs:
+        yield para.text
 
 
 def _extract_pptx_text(path: Path) -> str:
+    return "\n".join(_iter_pptx_text(path))
+
+
+def _iter_pptx_text(path: Path) -> Iterator[str]:
     try:
         from pptx import Presentation  # type: ignore[import-untyped]
     except ImportError as exc:
@@ -137,16 +248,28 @@ def _extract_pptx_text(path: Path) -> str:
         ) from exc
 
     prs = Presentation(str(path))
-    parts = []
     for slide in prs.slides:
         for shape in slide.shapes:
             if shape.has_text_frame:
                 for para in shape.text_frame.paragraphs:
-                    parts.append(para.text)
-    return "\n".join(parts)
+                    yield para.text
 
 
 def _extract_xlsx_text(path: Path) -> str:
+    return "\n".join(_iter_xlsx_text(path))
+
+
+def _iter_xlsx_text(path: Path) -> Iterator[str]:
+    try:
+        # Optional: python-calamine's Rust reader is over ten times faster
+        # than openpyxl on large sheets.
+        from python_calamine import CalamineWorkbook  # type: ignore[import-untyped]
+    except ImportError:
+        pass
+    else:
+        yield from _iter_xlsx_text_calamine(CalamineWorkbook, path)
+        return
+
     try:
         import openpyxl  # type: ignore[import-untyped]
     except ImportError as exc:
@@ -156,17 +279,43 @@ def _extract_xlsx_text(path: Path) -> str:
         ) from exc
 
     wb = openpyxl.load_workbook(str(path), read_only=True, data_only=True)
-    parts = []
     for sheet in wb.worksheets:
         for row in sheet.iter_rows(values_only=True):
-            row_text = "\t".join("" if cell is None else str(cell) for cell in row)
-            parts.append(row_text)
-    return "\n".join(parts)
+            yield "\t".join("" if cell is None else str(cell) for cell in row)
+
+
+def _iter_xlsx_text_calamine(workbook_cls, path: Path) -> Iterator[str]:
+    wb = workbook_cls.from_path(str(path))
+    try:
+        for name in wb.sheet_names:
+            # Keep leading empty rows and columns, as openpyxl does.
+            rows = wb.get_sheet_by_name(name).to_python(skip_empty_area=False)
+            for row in rows:
+                yield "\t".join(_calamine_cell_text(cell) for cell in row)
+    finally:
+        wb.close()
+
+
+def _calamine_cell_text(cell) -> str:
+    """Format a python-calamine cell value the way openpyxl's would print."""
+    if cell is None or cell == "":
+        return ""
+    # Calamine reads every number as a float; openpyxl keeps integers as int.
+    if type(cell) is float and cell.is_integer() and abs(cell) < 1e16:
+        return str(int(cell))
+    # Date-only cells come back as dates; openpyxl always gives datetimes.
+    if type(cell) is datetime.date:
+        return str(datetime.datetime.combine(cell, datetime.time()))
+    return str(cell)
 
 
 def _extract_odf_text(path: Path) -> str:
+    return "\n".join(_iter_odf_text(path))
+
+
+def _iter_odf_text(path: Path) -> Iterator[str]:
     try:
-        from odf import opendocument  # type: ignore[import-untyped]
+        from odf import opendocument, teletype  # type: ignore[import-untyped]
     except ImportError as exc:
         raise ImportError(
             "odfpy is required to extract text from ODF files.  "
@@ -174,21 +323,14 @@ def _extract_odf_text(path: Path) -> str:
         ) from exc
 
     doc = opendocument.load(str(path))
-    parts = []
     for elem in doc.body.childNodes:
-        _collect_odf_text(elem, parts)
-    return "\n".join(parts)
-
-
-def _collect_odf_text(node, parts: list[str]) -> None:
-    from odf import teletype  # type: ignore[import-untyped]
-
-    try:
-        text = teletype.extractText(node)
+        # Skip elements teletype cannot handle rather than failing the file.
+        try:
+            text = teletype.extractText(elem)
+        except Exception:
+            continue
         if text:
-            parts.append(text)
-    except Exception:
-        pass
+            yield text
 
 
 def _extract_rtf_text(path: Path) -> str:
@@ -204,6 +346,24 @@ def _extract_rtf_text(path: Path) -> str:
     return rtf_to_text(raw)
 
 
+#: Whole-document extractors, keyed by lower-case suffix.
+_TEXT_EXTRACTORS: dict[str, Callable[[Path], str]] = {
+    ".txt": _extract_text_plain,
+    ".csv": _extract_text_plain,
+    ".md": _extract_text_plain,
+    ".html": _extract_html_text,
+    ".htm": _extract_html_text,
+    ".pdf": _extract_pdf_text,
+    ".docx": _extract_docx_text,
+    ".pptx": _extract_pptx_text,
+    ".xlsx": _extract_xlsx_text,
+    ".odt": _extract_odf_text,
+    ".odp": _extract_odf_text,
+    ".ods": _extract_odf_text,
+    ".rtf": _extract_rtf_text,
+}
+
+
 def extract_text(path: Path) -> str:
     """Extract plain text from *path*.
 
@@ -225,25 +385,63 @@ def extract_text(path: Path) -> str:
         When the format is not supported for text extraction.
     """
     suffix = path.suffix.lower()
-    if suffix in {".txt", ".csv", ".md"}:
-        return _extract_text_plain(path)
-    if suffix in {".html", ".htm"}:
-        return _extract_html_text(path)
-    if suffix == ".pdf":
-        return _extract_pdf_text(path)
-    if suffix == ".docx":
-        return _extract_docx_text(path)
-    if suffix == ".pptx":
-        return _extract_pptx_text(path)
-    if suffix == ".xlsx":
-        return _extract_xlsx_text(path)
-    if suffix in {".odt", ".odp", ".ods"}:
-        return _extract_odf_text(path)
-    if suffix == ".rtf":
-        return _extract_rtf_text(path)
-    raise ValueError(
-        f"Text extraction is not supported for format '{suffix}'."
-    )
+    extractor = _TEXT_EXTRACTORS.get(suffix)
+    if extractor is None:
+        raise ValueError(
+            f"Text extraction is not supported for format '{suffix}'."
+        )
+    return extractor(path)
+
+
+def _with_separator(pieces: Iterable[str], sep: str) -> Iterator[str]:
+    """Yield *pieces* with *sep* between consecutive ones, like ``sep.join``."""
+    first = True
+    for piece in pieces:
+        if not first:
+            yield sep
+        first = False
+        yield piece
+
+
+#: Formats streamed in blocks by :func:`_iter_text_plain`.
+_PLAIN_TEXT_FORMATS: frozenset[str] = frozenset({".txt", ".csv", ".md"})
+
+#: Piece-by-piece extractors: pages, paragraphs, rows or top-level elements.
+_PIECE_EXTRACTORS: dict[str, Callable[[Path], Iterator[str]]] = {
+    ".pdf": _iter_pdf_text,
+    ".docx": _iter_docx_text,
+    ".pptx": _iter_pptx_text,
+    ".xlsx": _iter_xlsx_text,
+    ".odt": _iter_odf_text,
+    ".odp": _iter_odf_text,
+    ".ods": _iter_odf_text,
+}
+
+
+def iter_text(path: Path) -> Iterator[str]:
+    """Yield the plain text of *path* piece by piece.
+
+    The pieces joined together equal :func:`extract_text`'s result, but the
+    whole text never has to be held in memory at once: PDFs are yielded a page
+    at a time, Office and OpenDocument files a paragraph or row at a time,
+    and plain-text files in blocks.  HTML and RTF are converted in one go.
+
+    Raises
+    ------
+    ImportError
+        When a required third-party library is not installed.
+    ValueError
+        When the format is not supported for text extraction.
+    """
+    suffix = path.suffix.lower()
+    if suffix in _PLAIN_TEXT_FORMATS:
+        yield from _iter_text_plain(path)
+        return
+    extractor = _PIECE_EXTRACTORS.get(suffix)
+    if extractor is not None:
+        yield from _with_separator(extractor(path), "\n")
+    else:
+        yield extract_text(path)
 
 
 # ---------------------------------------------------------------------------
@@ -274,12 +472,17 @@ def needs_split(
         return True
     if _text is not None:
         return len(_text) > max_child_text_chars
-    # Extract text to check; if extraction fails treat as no split needed
+    # Count the text as it is extracted and stop as soon as it is too long;
+    # if extraction fails treat as no split needed
+    total_chars = 0
     try:
-        text = extract_text(path)
-    except (ImportError, ValueError, Exception):
+        for piece in iter_text(path):
+            total_chars += len(piece)
+            if total_chars > max_child_text_chars:
+                return True
+    except Exception:
         return False
-    return len(text) > max_child_text_chars
+    return False
 
 
 # ---------------------------------------------------------------------------
@@ -287,21 +490,12 @@ def needs_split(
 # ---------------------------------------------------------------------------
 
 
-def _split_text_into_chunks(text: str, max_chars: int) -> list[str]:
-    """Split *text* into chunks of at most *max_chars* characters."""
-    chunks = []
-    start = 0
-    while start < len(text):
-        chunks.append(text[start : start + max_chars])
-        start += max_chars
-    return chunks
-
-
 def segment_document(
     source: Path,
     output_dir: Path,
     max_child_bytes: int,
     max_child_text_chars: int,
+    size: int | None = None,
 ) -> SegmentResult:
     """Process a single document.
 
@@ -315,6 +509,9 @@ def segment_document(
         Maximum allowed file size; triggers splitting when exceeded.
     max_child_text_chars:
         Maximum allowed extracted text length; triggers splitting when exceeded.
+    size:
+        Size of *source* in bytes, when the caller already knows it;
+        otherwise the file is stat'ed once.
 
     Returns
     -------
@@ -326,16 +523,18 @@ def segment_document(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     suffix = source.suffix.lower()
+    if size is None:
+        size = source.stat().st_size
 
     # ------------------------------------------------------------------ #
     # Out-of-scope formats
     # ------------------------------------------------------------------ #
     if suffix in OUT_OF_SCOPE_FORMATS:
-        size_exceeds = source.stat().st_size > max_child_bytes
+        size_exceeds = size > max_child_bytes
         if not size_exceeds:
             # Case A: copy unchanged
             dest = output_dir / source.name
-            shutil.copy2(source, dest)
+            _fast_copy(source, dest)
             return SegmentResult(source=source, status=SegmentStatus.OK, children=[dest])
         else:
             # Case B: splitting would be required but format not supported
@@ -354,48 +553,118 @@ def segment_document(
     if suffix not in SUPPORTED_FORMATS:
         # Unknown format — copy unchanged (treated as successfully processed)
         dest = output_dir / source.name
-        shutil.copy2(source, dest)
+        _fast_copy(source, dest)
         return SegmentResult(source=source, status=SegmentStatus.OK, children=[dest])
 
-    # Extract text; handle missing dependency
+    # Stream the text straight into child files.  It is only buffered until
+    # either the file size or the text length shows that a split is needed,
+    # so at most about one child's worth of text is held in memory.
+    split_needed = size > max_child_bytes
+    children: list[Path] = []
+    pending: list[str] = []
+    pending_chars = 0
+    total_chars = 0
+    stem = source.stem
+
+    def flush(final: bool) -> None:
+        # Write every complete child straight from the buffered text, one
+        # slice at a time; keep a short tail unless this is the last flush.
+        nonlocal pending_chars
+        text = "".join(pending)
+        pending.clear()
+        end = len(text) if final else len(text) - len(text) % max_child_text_chars
+        for start in range(0, end, max_child_text_chars):
+            child_path = output_dir / f"{stem}_part{len(children) + 1:04d}.txt"
+            _write_child(child_path, text[start : start + max_child_text_chars])
+            children.append(child_path)
+        pending_chars = len(text) - end
+        if pending_chars:
+            pending.append(text[end:])
+
     try:
-        text = extract_text(source)
-    except ImportError as exc:
-        return SegmentResult(
-            source=source,
-            status=SegmentStatus.MISSING_DEP,
-            error_msg=str(exc),
-        )
+        pieces = iter_text(source)
+        piece = next(pieces, None)
     except Exception as exc:
-        return SegmentResult(
-            source=source,
-            status=SegmentStatus.ERROR,
-            error_msg=f"Failed to extract text from '{source}': {exc}",
-        )
-
-    split_needed = (
-        source.stat().st_size > max_child_bytes or len(text) > max_child_text_chars
-    )
+        return _extraction_failed(source, exc)
+    while piece is not None:
+        pending.append(piece)
+        pending_chars += len(piece)
+        total_chars += len(piece)
+        if total_chars > max_child_text_chars:
+            split_needed = True
+        if split_needed and pending_chars >= max_child_text_chars:
+            flush(final=False)
+        try:
+            piece = next(pieces, None)
+        except Exception as exc:
+            _remove_children(children)
+            return _extraction_failed(source, exc)
 
     if not split_needed:
         # Copy unchanged
         dest = output_dir / source.name
-        shutil.copy2(source, dest)
+        _fast_copy(source, dest)
         return SegmentResult(source=source, status=SegmentStatus.OK, children=[dest])
 
-    # Split into child text files
-    chunks = _split_text_into_chunks(text, max_child_text_chars)
-    children: list[Path] = []
-    stem = source.stem
-    for i, chunk in enumerate(chunks, start=1):
-        child_name = f"{stem}_part{i:04d}.txt"
-        child_path = output_dir / child_name
-        child_path.write_text(chunk, encoding="utf-8")
-        children.append(child_path)
-
+    flush(final=True)
     return SegmentResult(source=source, status=SegmentStatus.OK, children=children)
 
 
+def _write_child(path: Path, text: str) -> None:
+    """Write *text* to *path* as UTF-8, exactly as ``path.write_text`` would.
+
+    The file is written with a single ``os.write`` on a raw descriptor,
+    which skips the buffered text-file objects ``write_text`` sets up for
+    every child.
+    """
+    if os.linesep != "\n":
+        # Text-mode files translate newlines on write; keep doing so.
+        text = text.replace("\n", os.linesep)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | O_BINARY, 0o666)
+    try:
+        write_all(fd, text.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def _fast_copy(source: Path, dest: Path) -> None:
+    """Copy *source* to *dest* unchanged, like :func:`shutil.copy2`.
+
+    The data is copied inside the kernel where possible (reflink,
+    ``copy_file_range`` or ``sendfile``); permission bits and timestamps are
+    then carried over with :func:`shutil.copystat`.  Like ``copy2``, raises
+    :class:`shutil.SameFileError` instead of truncating *source* when *dest*
+    is the same file.  Anything but a regular file is handed to ``copy2``
+    itself, which refuses FIFOs and devices instead of blocking on them.
+    """
+    if not stat.S_ISREG(os.stat(source).st_mode):
+        shutil.copy2(source, dest)
+        return
+    if os.path.exists(dest) and os.path.samefile(source, dest):
+        raise shutil.SameFileError(f"{str(source)!r} and {str(dest)!r} are the same file")
+    with open(source, "rb") as src_fh, open(dest, "wb") as dst_fh:
+        size = os.fstat(src_fh.fileno()).st_size
+        copy_range(src_fh.fileno(), dst_fh.fileno(), 0, size)
+    shutil.copystat(source, dest)
+
+
+def _extraction_failed(source: Path, exc: Exception) -> SegmentResult:
+    """Build the result for a document whose text could not be extracted."""
+    if isinstance(exc, ImportError):
+        return SegmentResult(source=source, status=SegmentStatus.MISSING_DEP, error_msg=str(exc))
+    return SegmentResult(
+        source=source,
+        status=SegmentStatus.ERROR,
+        error_msg=f"Failed to extract text from '{source}': {exc}",
+    )
+
+
+def _remove_children(children: list[Path]) -> None:
+    """Delete child files written before a document failed part-way."""
+    for child in children:
+        child.unlink(missing_ok=True)
+
+
 # ---------------------------------------------------------------------------
 # Folder-level segmentation
 # ---------------------------------------------------------------------------
@@ -407,6 +676,7 @@ def segment_folder(
     max_child_bytes: int,
     max_child_text_chars: int,
     fail_fast: bool = False,
+    jobs: int = 1,
 ) -> list[SegmentResult]:
     """Recursively segment all documents in *input_dir*.
 
@@ -424,29 +694,110 @@ def segment_folder(
         Maximum child text length in characters.
     fail_fast:
         When ``True``, stop processing after the first error.
+    jobs:
+        Number of documents processed at a time, each in its own worker
+        process (default 1).  Results are returned in the same order either
+        way.
 
     Returns
     -------
     list[SegmentResult]
-        One result per processed file.
+        One result per processed file; empty when *input_dir* is missing or
+        cannot be listed.
     """
     input_dir = Path(input_dir)
     output_dir = Path(output_dir)
-    results: list[SegmentResult] = []
+    # (source, output directory, size) triples; the output mirrors
+    # input_dir's layout.  The walk is lazy, so a sequential fail-fast run
+    # stops listing directories at the first error.
+    tasks: Iterable[tuple[Path, Path, int]] = _walk_files(input_dir, output_dir)
 
-    for source in sorted(input_dir.rglob("*")):
-        if not source.is_file():
-            continue
-        relative = source.relative_to(input_dir)
-        child_output_dir = output_dir / relative.parent
+    if jobs > 1:
+        tasks = list(tasks)
+        if len(tasks) > 1:
+            return _segment_parallel(tasks, max_child_bytes, max_child_text_chars, fail_fast, jobs)
+
+    results: list[SegmentResult] = []
+    for source, child_output_dir, size in tasks:
         result = segment_document(
             source=source,
             output_dir=child_output_dir,
             max_child_bytes=max_child_bytes,
             max_child_text_chars=max_child_text_chars,
+            size=size,
         )
         results.append(result)
         if fail_fast and result.status != SegmentStatus.OK:
             break
 
     return results
+
+
+def _walk_files(directory: Path, output_dir: Path) -> Iterator[tuple[Path, Path, int]]:
+    """Yield ``(path, output directory, size)`` for every file below *directory*.
+
+    The output directory mirrors the file's place below *directory* inside
+    *output_dir*; it is built once per directory, not per file.  Files come
+    in the same order as ``sorted(directory.rglob("*"))``: entries are
+    sorted by name within each directory and subdirectories are walked where
+    they sort.  Symlinked directories are not followed, and directories that
+    are missing or cannot be listed, *directory* included, yield nothing, as
+    with ``rglob``.  The directory listing already tells files from
+    directories, so each file costs a single ``stat`` for its size.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: os.path.normcase(entry.name))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_files(Path(entry.path), output_dir / entry.name)
+        elif entry.is_file():
+            yield Path(entry.path), output_dir, entry.stat().st_size
+
+
+def _segment_parallel(
+    tasks: list[tuple[Path, Path, int]],
+    max_child_bytes: int,
+    max_child_text_chars: int,
+    fail_fast: bool,
+    jobs: int,
+) -> list[SegmentResult]:
+    """Run :func:`segment_document` for each ``(source, output_dir, size)`` task on
+    a pool of *jobs* processes.
+
+    Text extraction is CPU-bound, so separate processes are used rather than
+    threads.  Results are collected in task order.  With *fail_fast*, tasks
+    after the first failure that have not started yet are cancelled; results
+    of ones already running are discarded, so the returned list is the same
+    as a sequential run would produce.
+    """
+    # Imported here so that sequential runs do not load multiprocessing.
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(jobs, len(tasks))
+    # Hand tasks to the workers in batches: folders of many small documents
+    # would otherwise spend more time on inter-process round trips than on
+    # the documents.  About four batches per worker keeps the load balanced
+    # and fail-fast cancellation prompt.
+    chunksize = max(1, len(tasks) // (workers * 4))
+    sources, output_dirs, sizes = zip(*tasks)
+    results: list[SegmentResult] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        outcomes = pool.map(
+            segment_document,
+            sources,
+            output_dirs,
+            repeat(max_child_bytes),
+            repeat(max_child_text_chars),
+            sizes,
+            chunksize=chunksize,
+        )
+        for result in outcomes:
+            results.append(result)
+            if fail_fast and result.status != SegmentStatus.OK:
+                # Closing the iterator cancels the batches not yet started.
+                outcomes.close()
+                break
+    return results
@@ -4,39 +4,78 @@ Tests for file_chopper — core logic and CLI.
 
 from __future__ import annotations
 
+import errno
+import os
+import shutil
+import struct
+import sys
 from pathlib import Path
 
 import pytest
 
 from file_chopper.chopper import (
+    PART_PATTERN,
     chop,
     find_parts,
     format_size,
     join,
+    match_part,
     parse_size,
     sha256_of_file,
 )
 from file_chopper.main import main
 
 
+#: Translation table that inverts every bit of a byte, for corrupting parts.
+_FLIP_TABLE = bytes(b ^ 0xFF for b in range(256))
+
+#: Payload of the ``tiny_file`` fixture.
+_TINY = b"A" * 100
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="session")
+def sample_bytes() -> bytes:
+    """The known 10 KiB payload behind ``tmp_file``, built once per session."""
+    return bytes(range(256)) * 40  # 10 240 bytes
+
+
 @pytest.fixture()
-def tmp_file(tmp_path: Path) -> Path:
+def tmp_file(tmp_path: Path, sample_bytes: bytes) -> Path:
     """A 10 KiB temporary file filled with known bytes."""
     p = tmp_path / "sample.bin"
-    p.write_bytes(bytes(range(256)) * 40)  # 10 240 bytes
+    p.write_bytes(sample_bytes)
     return p
 
 
+@pytest.fixture(scope="class")
+def _chopped_dir(tmp_path_factory, sample_bytes: bytes) -> Path:
+    """``tmp_file``'s payload chopped once per test class into 1 KiB parts."""
+    directory = tmp_path_factory.mktemp("chopped")
+    source = directory / "sample.bin"
+    source.write_bytes(sample_bytes)
+    chop(source, chunk_size=1024, output_dir=directory, verify=True)
+    source.unlink()
+    return directory
+
+
+@pytest.fixture()
+def chopped_parts(_chopped_dir: Path, tmp_path: Path) -> list[Path]:
+    """Fresh copies of the ten ``sample.bin`` parts and checksum file in *tmp_path*."""
+    for item in _chopped_dir.iterdir():
+        shutil.copyfile(item, tmp_path / item.name)
+    return find_parts(tmp_path, "sample.bin")
+
+
 @pytest.fixture()
 def tiny_file(tmp_path: Path) -> Path:
     """A 100-byte file."""
     p = tmp_path / "tiny.txt"
-    p.write_bytes(b"A" * 100)
+    p.write_bytes(_TINY)
     return p
 
 
@@ -46,40 +85,32 @@ def tiny_file(tmp_path: Path) -> Path:
 
 
 class TestParseSize:
-    def test_plain_bytes(self):
-        assert parse_size("512") == 512
-
-    def test_bytes_suffix(self):
-        assert parse_size("512B") == 512
-
-    def test_kilobytes(self):
-        assert parse_size("1K") == 1024
-        assert parse_size("1KB") == 1024
-
-    def test_megabytes(self):
-        assert parse_size("1M") == 1024**2
-        assert parse_size("1MB") == 1024**2
-
-    def test_gigabytes(self):
-        assert parse_size("2G") == 2 * 1024**3
-        assert parse_size("2GB") == 2 * 1024**3
-
-    def test_case_insensitive(self):
-        assert parse_size("100mb") == 100 * 1024**2
-
-    def test_decimal(self):
-        assert parse_size("1.5K") == int(1.5 * 1024)
-
-    def test_whitespace(self):
-        assert parse_size("  10 MB  ") == 10 * 1024**2
-
-    def test_invalid_raises(self):
-        with pytest.raises(ValueError, match="Cannot parse"):
-            parse_size("abc")
-
-    def test_unknown_unit_raises(self):
-        with pytest.raises(ValueError, match="Unknown size unit"):
-            parse_size("10XB")
+    @pytest.mark.parametrize(
+        ("size_str", "expected"),
+        [
+            ("512", 512),
+            ("512B", 512),
+            ("1K", 1024),
+            ("1KB", 1024),
+            ("1M", 1024**2),
+            ("1MB", 1024**2),
+            ("2G", 2 * 1024**3),
+            ("2GB", 2 * 1024**3),
+            ("100mb", 100 * 1024**2),  # case-insensitive
+            ("1.5K", int(1.5 * 1024)),  # decimal
+            ("  10 MB  ", 10 * 1024**2),  # surrounding whitespace
+        ],
+    )
+    def test_parses(self, size_str: str, expected: int):
+        assert parse_size(size_str) == expected
+
+    @pytest.mark.parametrize(
+        ("size_str", "message"),
+        [("abc", "Cannot parse"), ("10XB", "Unknown size unit")],
+    )
+    def test_invalid_raises(self, size_str: str, message: str):
+        with pytest.raises(ValueError, match=message):
+            parse_size(size_str)
 
 
 # ---------------------------------------------------------------------------
@@ -104,13 +135,15 @@ class TestFormatSize:
 
 
 class TestChop:
-    def test_splits_into_correct_number_of_parts(self, tmp_file: Path, tmp_path: Path):
-        parts = chop(tmp_file, chunk_size=1024, output_dir=tmp_path, verify=False)
+    # The read-only checks share the class's single 1 KiB chop in _chopped_dir.
+    def test_splits_into_correct_number_of_parts(self, _chopped_dir: Path):
+        parts = find_parts(_chopped_dir, "sample.bin")
         # 10 240 bytes / 1 024 = exactly 10 parts
         assert len(parts) == 10
+        assert [p.stat().st_size for p in parts] == [1024] * 10
 
-    def test_parts_named_correctly(self, tmp_file: Path, tmp_path: Path):
-        parts = chop(tmp_file, chunk_size=1024, output_dir=tmp_path, verify=False)
+    def test_parts_named_correctly(self, _chopped_dir: Path):
+        parts = find_parts(_chopped_dir, "sample.bin")
         assert parts[0].name == "sample.bin.part0001"
         assert parts[-1].name == "sample.bin.part0010"
 
@@ -119,13 +152,17 @@ class TestChop:
         total = sum(p.stat().st_size for p in parts)
         assert total == tmp_file.stat().st_size
 
-    def test_checksum_file_created(self, tmp_file: Path, tmp_path: Path):
-        chop(tmp_file, chunk_size=1024, output_dir=tmp_path, verify=True)
-        checksum_path = tmp_path / "sample.bin.sha256"
+    def test_checksum_file_created(self, _chopped_dir: Path):
+        checksum_path = _chopped_dir / "sample.bin.sha256"
         assert checksum_path.exists()
         content = checksum_path.read_text()
         assert len(content.split()[0]) == 64  # SHA-256 hex digest
 
+    def test_checksum_matches_source(self, tmp_file: Path, tmp_path: Path):
+        chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=True)
+        content = (tmp_path / "sample.bin.sha256").read_text()
+        assert content == f"{sha256_of_file(tmp_file)}  sample.bin\n"
+
     def test_no_checksum_when_verify_false(self, tmp_file: Path, tmp_path: Path):
         chop(tmp_file, chunk_size=1024, output_dir=tmp_path, verify=False)
         checksum_path = tmp_path / "sample.bin.sha256"
@@ -135,6 +172,21 @@ class TestChop:
         with pytest.raises(FileNotFoundError, match="not found"):
             chop(tmp_path / "ghost.bin", chunk_size=1024)
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs POSIX symlinks")
+    def test_symlink_loop_source_raises_not_found(self, tmp_path: Path):
+        loop = tmp_path / "loop.bin"
+        loop.symlink_to(loop.name)
+        with pytest.raises(FileNotFoundError, match="not found"):
+            chop(loop, chunk_size=1024)
+
+    def test_unreadable_source_raises_permission_error(self, tmp_file: Path, monkeypatch):
+        def _stat(path, *args, **kwargs):
+            raise PermissionError(errno.EACCES, "Permission denied", str(path))
+
+        monkeypatch.setattr(os, "stat", _stat)
+        with pytest.raises(PermissionError):
+            chop(tmp_file, chunk_size=1024)
+
     def test_source_is_directory_raises(self, tmp_path: Path):
         with pytest.raises(IsADirectoryError):
             chop(tmp_path, chunk_size=1024)
@@ -149,6 +201,40 @@ class TestChop:
         with pytest.raises(ValueError, match="empty"):
             chop(empty, chunk_size=1024)
 
+    def test_round_trip_with_per_part_checksums(self, tmp_file: Path, tmp_path: Path):
+        parts = chop(tmp_file, chunk_size=1000, output_dir=tmp_path, verify=True, jobs=4)
+        result = join(parts, output=tmp_path / "out.bin", verify=True, jobs=4)
+        assert result.read_bytes() == tmp_file.read_bytes()
+
+    def test_per_part_checksum_names_corrupt_part(self, tmp_file: Path, tmp_path: Path):
+        parts = chop(tmp_file, chunk_size=1024, output_dir=tmp_path, verify=True, jobs=2)
+        parts[2].write_bytes(parts[2].read_bytes().translate(_FLIP_TABLE))
+        output = tmp_path / "bad.bin"
+        with pytest.raises(ValueError, match="sample.bin.part0003"):
+            join(parts, output=output, verify=True)
+        assert not output.exists()
+
+    def test_per_part_checksum_detects_missing_part(self, tmp_file: Path, tmp_path: Path):
+        parts = chop(tmp_file, chunk_size=1024, output_dir=tmp_path, verify=True, jobs=2)
+        del parts[4]
+        with pytest.raises(ValueError, match="Checksum mismatch"):
+            join(parts, output=tmp_path / "bad.bin", verify=True)
+
+    def test_per_part_checksum_detects_reordered_parts(self, tmp_file: Path, tmp_path: Path):
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=True, jobs=2)
+        parts[0], parts[1] = parts[1], parts[0]
+        output = tmp_path / "bad.bin"
+        with pytest.raises(ValueError, match="Joined order"):
+            join(parts, output=output, verify=True)
+        assert not output.exists()
+
+    def test_per_part_checksum_detects_duplicated_part(self, tmp_file: Path, tmp_path: Path):
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=True, jobs=2)
+        output = tmp_path / "bad.bin"
+        with pytest.raises(ValueError, match="Joined order"):
+            join([parts[0], *parts], output=output, verify=True)
+        assert not output.exists()
+
     def test_progress_callback_called(self, tmp_file: Path, tmp_path: Path):
         calls = []
         chop(
@@ -161,6 +247,159 @@ class TestChop:
         assert len(calls) == 10
         assert calls[-1] == (10240, 10240)
 
+    @pytest.mark.parametrize(
+        "disabled",
+        [("copy_file_range",), ("copy_file_range", "sendfile")],
+        ids=["sendfile", "read-write"],
+    )
+    def test_parts_match_source_without_kernel_copy(
+        self, tmp_file: Path, tmp_path: Path, monkeypatch, disabled
+    ):
+        for name in disabled:
+            monkeypatch.delattr(os, name, raising=False)
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=False)
+        assert b"".join(p.read_bytes() for p in parts) == tmp_file.read_bytes()
+
+    def test_falls_back_when_copy_file_range_unsupported(
+        self, tmp_file: Path, tmp_path: Path, monkeypatch
+    ):
+        def _exdev(*args, **kwargs):
+            raise OSError(errno.EXDEV, "cross-device")
+
+        monkeypatch.setattr(os, "copy_file_range", _exdev, raising=False)
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=False)
+        assert b"".join(p.read_bytes() for p in parts) == tmp_file.read_bytes()
+
+    def test_falls_back_when_sendfile_needs_socket(
+        self, tmp_file: Path, tmp_path: Path, monkeypatch
+    ):
+        import file_chopper.chopper as chopper_mod
+
+        def _enotsock(*args, **kwargs):
+            raise OSError(errno.ENOTSOCK, "Socket operation on non-socket")
+
+        buffered = []
+        real_buffered = chopper_mod._copy_buffered
+
+        def _record(src_fd, dst_fd, offset, count):
+            buffered.append((offset, count))
+            real_buffered(src_fd, dst_fd, offset, count)
+
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+        monkeypatch.setattr(chopper_mod, "_SENDFILE_TO_FILE", True)
+        monkeypatch.setattr(os, "sendfile", _enotsock, raising=False)
+        monkeypatch.setattr(chopper_mod, "_copy_buffered", _record)
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=False)
+        assert b"".join(p.read_bytes() for p in parts) == tmp_file.read_bytes()
+        assert buffered == [(0, 3000), (3000, 3000), (6000, 3000), (9000, 1240)]
+
+    def test_sendfile_not_tried_outside_linux(self, tmp_file: Path, tmp_path: Path, monkeypatch):
+        import file_chopper.chopper as chopper_mod
+
+        def _unexpected(*args, **kwargs):
+            raise AssertionError("sendfile() called")
+
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+        monkeypatch.setattr(chopper_mod, "_SENDFILE_TO_FILE", False)
+        monkeypatch.setattr(os, "sendfile", _unexpected, raising=False)
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=False)
+        assert b"".join(p.read_bytes() for p in parts) == tmp_file.read_bytes()
+
+    def test_checksum_without_mmap(self, tmp_file: Path, tmp_path: Path, monkeypatch):
+        import mmap
+
+        def _unmappable(*args, **kwargs):
+            raise OSError(errno.ENODEV, "cannot map")
+
+        monkeypatch.setattr(mmap, "mmap", _unmappable)
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=True)
+        content = (tmp_path / "sample.bin.sha256").read_text()
+        assert content == f"{sha256_of_file(tmp_file)}  sample.bin\n"
+        assert b"".join(p.read_bytes() for p in parts) == tmp_file.read_bytes()
+
+    def test_source_cache_dropped_after_each_part(
+        self, tmp_file: Path, tmp_path: Path, monkeypatch
+    ):
+        import file_chopper.chopper as chopper_mod
+
+        if chopper_mod._FADV_DONTNEED is None:
+            pytest.skip("posix_fadvise is not available")
+        calls = []
+
+        def _record(fd, offset, length, advice):
+            calls.append((offset, length, advice))
+
+        monkeypatch.setattr(os, "posix_fadvise", _record)
+        chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=False)
+        dropped = [(o, n) for o, n, advice in calls if advice == chopper_mod._FADV_DONTNEED]
+        assert dropped[:4] == [(0, 3000), (3000, 3000), (6000, 3000), (9000, 1240)]
+
+    def test_checksum_through_mmap_windows(
+        self, tmp_file: Path, tmp_path: Path, monkeypatch
+    ):
+        import file_chopper.chopper as chopper_mod
+
+        monkeypatch.setattr(chopper_mod, "_MMAP_MIN_SIZE", 0)
+        monkeypatch.setattr(chopper_mod, "BUFFER_SIZE", 1000)
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=True)
+        content = (tmp_path / "sample.bin.sha256").read_text()
+        assert content == f"{sha256_of_file(tmp_file)}  sample.bin\n"
+        assert b"".join(p.read_bytes() for p in parts) == tmp_file.read_bytes()
+
+    def test_write_error_during_mapped_copy_propagates(
+        self, tmp_file: Path, tmp_path: Path, monkeypatch
+    ):
+        import file_chopper.chopper as chopper_mod
+
+        def _disk_full(fd, data):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(chopper_mod, "_MMAP_MIN_SIZE", 0)
+        monkeypatch.setattr(chopper_mod, "write_all", _disk_full)
+        with pytest.raises(OSError) as exc_info:
+            chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=True)
+        assert exc_info.value.errno == errno.ENOSPC
+
+    def test_parallel_parts_match_sequential(self, tmp_file: Path, tmp_path: Path):
+        seq_dir, par_dir = tmp_path / "seq", tmp_path / "par"
+        seq = chop(tmp_file, chunk_size=1000, output_dir=seq_dir, verify=True)
+        par = chop(tmp_file, chunk_size=1000, output_dir=par_dir, verify=True, jobs=4)
+        assert [p.name for p in par] == [p.name for p in seq]
+        assert [p.read_bytes() for p in par] == [p.read_bytes() for p in seq]
+
+    def test_parallel_checksum_lists_each_part(self, tmp_file: Path, tmp_path: Path):
+        import hashlib
+
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=True, jobs=2)
+        expected = "".join(
+            f"{hashlib.sha256(p.read_bytes()).hexdigest()}  {p.name}\n" for p in parts
+        )
+        assert (tmp_path / "sample.bin.sha256").read_text() == expected
+
+    def test_parallel_single_part_records_whole_file_digest(
+        self, tiny_file: Path, tmp_path: Path
+    ):
+        chop(tiny_file, chunk_size=1024, output_dir=tmp_path, verify=True, jobs=4)
+        content = (tmp_path / "tiny.txt.sha256").read_text()
+        assert content == f"{sha256_of_file(tiny_file)}  tiny.txt\n"
+
+    def test_parallel_progress_reaches_total(self, tmp_file: Path, tmp_path: Path):
+        calls = []
+        chop(
+            tmp_file,
+            chunk_size=1024,
+            output_dir=tmp_path,
+            progress_cb=lambda done, total: calls.append((done, total)),
+            verify=False,
+            jobs=3,
+        )
+        assert len(calls) == 10
+        assert calls[-1] == (10240, 10240)
+
+    def test_zero_jobs_raises(self, tmp_file: Path):
+        with pytest.raises(ValueError, match="jobs"):
+            chop(tmp_file, chunk_size=1024, jobs=0)
+
     def test_default_output_dir_is_source_parent(self, tmp_file: Path):
         parts = chop(tmp_file, chunk_size=5000, verify=False)
         for p in parts:
@@ -176,42 +415,156 @@ class TestChop:
 
 
 class TestJoin:
-    def test_round_trip(self, tmp_file: Path, tmp_path: Path):
-        parts = chop(tmp_file, chunk_size=1024, output_dir=tmp_path, verify=True)
+    def test_round_trip(self, chopped_parts: list[Path], sample_bytes: bytes, tmp_path: Path):
         output = tmp_path / "reassembled.bin"
-        result = join(parts, output=output, verify=True)
+        result = join(chopped_parts, output=output, verify=True)
         assert result == output
+        assert result.read_bytes() == sample_bytes
+
+    def test_whole_file_checksum_after_renaming(
+        self, chopped_parts: list[Path], sample_bytes: bytes, tmp_path: Path
+    ):
+        renamed = []
+        for part in chopped_parts:
+            target = part.with_name(part.name.replace("sample.bin", "renamed.bin"))
+            part.rename(target)
+            renamed.append(target)
+        (tmp_path / "sample.bin.sha256").rename(tmp_path / "renamed.bin.sha256")
+        result = join(renamed, output=tmp_path / "renamed.bin", verify=True)
+        assert result.read_bytes() == sample_bytes
+
+    def test_round_trip_of_source_named_like_a_part(self, sample_bytes: bytes, tmp_path: Path):
+        source = tmp_path / "x.part0001"
+        source.write_bytes(sample_bytes)
+        out_dir = tmp_path / "parts"
+        parts = chop(source, chunk_size=1024, output_dir=out_dir, verify=True)
+        result = join(parts, verify=True)
+        assert result == out_dir / "x.part0001"
+        assert result.read_bytes() == sample_bytes
+
+    def test_round_trip_with_known_sizes(self, tmp_file: Path, tmp_path: Path):
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=True)
+        calls = []
+        result = join(
+            parts,
+            output=tmp_path / "reassembled.bin",
+            progress_cb=lambda done, total: calls.append(total),
+            sizes=[3000, 3000, 3000, 1240],
+        )
+        assert result.read_bytes() == tmp_file.read_bytes()
+        assert set(calls) == {10240}
+
+    def test_known_sizes_missing_part_raises(self, tmp_file: Path, tmp_path: Path):
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=False)
+        parts[2].unlink()
+        with pytest.raises(FileNotFoundError, match="Part file not found"):
+            join(parts, output=tmp_path / "reassembled.bin", sizes=[3000, 3000, 3000, 1240])
+
+    def test_sizes_must_match_parts(self, tmp_file: Path, tmp_path: Path):
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=False)
+        with pytest.raises(ValueError, match="sizes"):
+            join(parts, output=tmp_path / "reassembled.bin", sizes=[3000])
+
+    @pytest.mark.parametrize(
+        "disabled",
+        [("copy_file_range",), ("copy_file_range", "sendfile")],
+        ids=["sendfile", "read-write"],
+    )
+    def test_round_trip_without_kernel_copy(
+        self, tmp_file: Path, tmp_path: Path, monkeypatch, disabled
+    ):
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=True)
+        for name in disabled:
+            monkeypatch.delattr(os, name, raising=False)
+        result = join(parts, output=tmp_path / "reassembled.bin", verify=True)
+        assert result.read_bytes() == tmp_file.read_bytes()
+
+    def test_round_trip_when_sendfile_needs_socket(
+        self, chopped_parts: list[Path], sample_bytes: bytes, tmp_path: Path, monkeypatch
+    ):
+        import file_chopper.chopper as chopper_mod
+
+        def _enotsock(*args, **kwargs):
+            raise OSError(errno.ENOTSOCK, "Socket operation on non-socket")
+
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+        monkeypatch.setattr(chopper_mod, "_SENDFILE_TO_FILE", True)
+        monkeypatch.setattr(os, "sendfile", _enotsock, raising=False)
+        result = join(chopped_parts, output=tmp_path / "reassembled.bin", verify=True)
+        assert result.read_bytes() == sample_bytes
+
+    def test_round_trip_through_buffer_pipeline(
+        self, tmp_file: Path, tmp_path: Path, monkeypatch
+    ):
+        import file_chopper.chopper as chopper_mod
+
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=True)
+        monkeypatch.setattr(chopper_mod, "BUFFER_SIZE", 256)
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+        monkeypatch.delattr(os, "sendfile", raising=False)
+        result = join(parts, output=tmp_path / "reassembled.bin", verify=True)
         assert result.read_bytes() == tmp_file.read_bytes()
 
+    def test_round_trip_when_preallocation_unsupported(
+        self, tmp_file: Path, tmp_path: Path, monkeypatch
+    ):
+        def _unsupported(*args, **kwargs):
+            raise OSError(errno.EOPNOTSUPP, "not supported")
+
+        monkeypatch.setattr(os, "posix_fallocate", _unsupported, raising=False)
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=True)
+        result = join(parts, output=tmp_path / "reassembled.bin", verify=True)
+        assert result.read_bytes() == tmp_file.read_bytes()
+
+    def test_preallocate_falls_back_to_f_preallocate(self, tmp_path: Path, monkeypatch):
+        import file_chopper.chopper as chopper_mod
+
+        calls = []
+
+        class _FakeFcntl:
+            @staticmethod
+            def fcntl(fd, cmd, arg):
+                flags = struct.unpack("Iiqqq", arg)[0]
+                calls.append((cmd, flags))
+                if flags & chopper_mod._F_ALLOCATECONTIG:
+                    raise OSError(errno.ENOSPC, "no contiguous space")
+                return arg
+
+        monkeypatch.delattr(os, "posix_fallocate", raising=False)
+        monkeypatch.setattr(chopper_mod, "fcntl", _FakeFcntl)
+        monkeypatch.setattr(chopper_mod, "_F_PREALLOCATE", 42)
+        with (tmp_path / "out.bin").open("wb") as fh:
+            chopper_mod._preallocate(fh.fileno(), 1000)
+        assert calls == [
+            (42, chopper_mod._F_ALLOCATECONTIG | chopper_mod._F_ALLOCATEALL),
+            (42, chopper_mod._F_ALLOCATEALL),
+        ]
+
     def test_join_infers_output_name(self, tmp_file: Path, tmp_path: Path):
         parts = chop(tmp_file, chunk_size=2000, output_dir=tmp_path, verify=False)
         result = join(parts, verify=False)
         assert result.name == "sample.bin"
         result.unlink()
 
-    def test_missing_part_raises(self, tmp_file: Path, tmp_path: Path):
-        parts = chop(tmp_file, chunk_size=1024, output_dir=tmp_path, verify=False)
-        parts[3].unlink()  # remove part 4
+    def test_missing_part_raises(self, chopped_parts: list[Path], tmp_path: Path):
+        chopped_parts[3].unlink()  # remove part 4
         with pytest.raises(FileNotFoundError, match="not found"):
-            join(parts, output=tmp_path / "out.bin", verify=False)
+            join(chopped_parts, output=tmp_path / "out.bin", verify=False)
 
     def test_empty_parts_raises(self):
         with pytest.raises(ValueError, match="No part files"):
             join([])
 
-    def test_checksum_mismatch_raises(self, tmp_file: Path, tmp_path: Path):
-        parts = chop(tmp_file, chunk_size=1024, output_dir=tmp_path, verify=True)
+    def test_checksum_mismatch_raises(self, chopped_parts: list[Path], tmp_path: Path):
         # Corrupt the first part
-        data = parts[0].read_bytes()
-        parts[0].write_bytes(bytes([b ^ 0xFF for b in data]))
+        chopped_parts[0].write_bytes(chopped_parts[0].read_bytes().translate(_FLIP_TABLE))
         with pytest.raises(ValueError, match="Checksum mismatch"):
-            join(parts, output=tmp_path / "bad.bin", verify=True)
+            join(chopped_parts, output=tmp_path / "bad.bin", verify=True)
 
-    def test_progress_callback_called(self, tmp_file: Path, tmp_path: Path):
-        parts = chop(tmp_file, chunk_size=1024, output_dir=tmp_path, verify=False)
+    def test_progress_callback_called(self, chopped_parts: list[Path], tmp_path: Path):
         calls = []
         join(
-            parts,
+            chopped_parts,
             output=tmp_path / "out.bin",
             progress_cb=lambda done, total: calls.append(done),
             verify=False,
@@ -225,17 +578,69 @@ class TestJoin:
 
 
 class TestFindParts:
-    def test_finds_parts_in_order(self, tmp_file: Path, tmp_path: Path):
-        chop(tmp_file, chunk_size=1024, output_dir=tmp_path, verify=False)
+    def test_finds_parts_in_order(self, chopped_parts: list[Path], tmp_path: Path):
         parts = find_parts(tmp_path, "sample.bin")
         assert len(parts) == 10
         assert parts[0].name == "sample.bin.part0001"
         assert parts[-1].name == "sample.bin.part0010"
 
+    def test_ignores_unrelated_and_malformed_names(self, tmp_path: Path):
+        for name in (
+            "sample.bin.part0002",
+            "sample.bin.part0001",
+            "sample.bin.part01",
+            "sample.bin.part0003.tmp",
+            "other.bin.part0001",
+            "sample.bin.sha256",
+        ):
+            (tmp_path / name).write_bytes(b"x")
+        parts = find_parts(tmp_path, "sample.bin")
+        assert [p.name for p in parts] == ["sample.bin.part0001", "sample.bin.part0002"]
+
+    def test_base_name_with_glob_characters(self, tmp_path: Path):
+        (tmp_path / "data[1].bin.part0001").write_bytes(b"x")
+        parts = find_parts(tmp_path, "data[1].bin")
+        assert [p.name for p in parts] == ["data[1].bin.part0001"]
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "sample.bin.part0001",
+            "a.part9999",
+            "x.part0001.part0002",
+            ".part0001",
+            "sample.bin.part01",
+            "sample.bin.part00a1",
+            "sample.bin.Part0001",
+            "sample.bin.part0001.tmp",
+        ],
+    )
+    def test_match_part_agrees_with_pattern(self, name: str):
+        m = PART_PATTERN.match(name)
+        expected = (m.group(1), int(m.group(2))) if m else None
+        assert match_part(name) == expected
+
     def test_no_parts_raises(self, tmp_path: Path):
         with pytest.raises(FileNotFoundError, match="No part files"):
             find_parts(tmp_path, "nonexistent.bin")
 
+    @pytest.mark.parametrize("kind", ["missing", "file", "unreadable"])
+    def test_unlistable_directory_raises_no_parts(
+        self, tmp_path: Path, monkeypatch, kind: str
+    ):
+        directory = tmp_path / "parts"
+        if kind == "file":
+            directory.write_bytes(b"x")
+        elif kind == "unreadable":
+            directory.mkdir()
+
+            def _denied(path):
+                raise PermissionError(errno.EACCES, "Permission denied", str(path))
+
+            monkeypatch.setattr(os, "scandir", _denied)
+        with pytest.raises(FileNotFoundError, match="No part files"):
+            find_parts(directory, "sample.bin")
+
 
 # ---------------------------------------------------------------------------
 # sha256_of_file
@@ -255,6 +660,40 @@ class TestSha256OfFile:
     def test_consistent(self, tmp_file: Path):
         assert sha256_of_file(tmp_file) == sha256_of_file(tmp_file)
 
+    def test_buffered_digest_without_mmap(self, tmp_file: Path, monkeypatch):
+        import hashlib
+
+        import file_chopper.chopper as chopper_mod
+
+        expected = hashlib.sha256(tmp_file.read_bytes()).hexdigest()
+        mapped = []
+
+        def _no_map(fd, size):
+            mapped.append(size)
+            return None
+
+        monkeypatch.setattr(chopper_mod, "_map_source", _no_map)
+        # A buffer smaller than the file makes the readinto loop run repeatedly.
+        monkeypatch.setattr(chopper_mod, "_HASH_BUFFER_SIZE", 1000)
+        assert sha256_of_file(tmp_file) == expected
+        assert mapped == [10240]
+
+    def test_mapped_digest(self, tmp_file: Path, monkeypatch):
+        import hashlib
+
+        import file_chopper.chopper as chopper_mod
+
+        expected = hashlib.sha256(tmp_file.read_bytes()).hexdigest()
+        monkeypatch.setattr(chopper_mod, "_MMAP_MIN_SIZE", 1)
+        assert sha256_of_file(tmp_file) == expected
+
+    def test_empty_file(self, tmp_path: Path):
+        import hashlib
+
+        p = tmp_path / "empty.bin"
+        p.write_bytes(b"")
+        assert sha256_of_file(p) == hashlib.sha256(b"").hexdigest()
+
 
 # ---------------------------------------------------------------------------
 # CLI — chop command
@@ -283,15 +722,70 @@ class TestCliChop:
         assert rc == 0
         assert len(list(tmp_path.glob("*.part*"))) == 10
 
+    def test_chop_parallel_chunks_round_trip(self, tmp_file: Path, tmp_path: Path):
+        args = ["--output-dir", str(tmp_path), "--quiet", "--parallel-chunks", "3"]
+        assert main(["chop", str(tmp_file), "--size", "1K", *args]) == 0
+        out = tmp_path / "out.bin"
+        first = str(tmp_path / "sample.bin.part0001")
+        rc = main(["join", first, "--output", str(out), "--quiet", "--parallel-chunks", "3"])
+        assert rc == 0
+        assert out.read_bytes() == tmp_file.read_bytes()
+
+    def test_chop_jobs_short_option(self, tmp_file: Path, tmp_path: Path):
+        rc = main(["chop", str(tmp_file), "-s", "1K", "-o", str(tmp_path), "-q", "-j", "4"])
+        assert rc == 0
+        assert len(list(tmp_path.glob("*.part*"))) == 10
+
+    def test_chop_zero_parallel_chunks_returns_1(self, tmp_file: Path):
+        rc = main(["chop", str(tmp_file), "--size", "1K", "--parallel-chunks", "0"])
+        assert rc == 1
+
     def test_chop_dry_run_no_files(self, tmp_file: Path, tmp_path: Path):
         rc = main(["chop", str(tmp_file), "--size", "1K", "--output-dir", str(tmp_path), "--dry-run"])
         assert rc == 0
         assert list(tmp_path.glob("*.part*")) == []
 
+    def test_chop_dry_run_elides_long_listings(self, tmp_file: Path, capsys):
+        rc = main(["chop", str(tmp_file), "--size", "100", "--dry-run"])
+        assert rc == 0
+        out = capsys.readouterr().out
+        assert out.count("Would create:") == 6
+        assert "... 97 more parts of 100 B each ..." in out
+        assert "sample.bin.part0103  (40 B)" in out
+
     def test_chop_missing_file_returns_1(self, tmp_path: Path):
         rc = main(["chop", str(tmp_path / "ghost.bin"), "--size", "1MB"])
         assert rc == 1
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs POSIX symlinks")
+    def test_chop_symlink_loop_returns_1(self, tmp_path: Path, capsys):
+        loop = tmp_path / "loop.bin"
+        loop.symlink_to(loop.name)
+        rc = main(["chop", str(loop), "--size", "1MB"])
+        assert rc == 1
+        assert "File not found" in capsys.readouterr().err
+
+    def test_text_progress_fallback_writes_to_stdout(self, capsys):
+        from file_chopper.main import _make_text_progress_cb
+
+        cb = _make_text_progress_cb("Chopping", 100)
+        cb(10, 100)
+        cb(100, 100)
+        captured = capsys.readouterr()
+        assert captured.out.endswith("\rChopping: 100.0%\n")
+        assert captured.err == ""
+
+    def test_chop_unreadable_source_returns_1(self, tmp_file: Path, monkeypatch, capsys):
+        def _stat(path, *args, **kwargs):
+            raise PermissionError(errno.EACCES, "Permission denied", str(path))
+
+        monkeypatch.setattr(os, "stat", _stat)
+        rc = main(["chop", str(tmp_file), "--size", "1MB"])
+        assert rc == 1
+        err = capsys.readouterr().err
+        assert "Cannot read file" in err
+        assert "Permission denied" in err
+
     def test_chop_invalid_size_returns_1(self, tmp_file: Path):
         rc = main(["chop", str(tmp_file), "--size", "badsize"])
         assert rc == 1
@@ -310,16 +804,13 @@ class TestCliJoin:
         captured = capsys.readouterr()
         assert "--output" in captured.out
 
-    def test_join_round_trip(self, tmp_file: Path, tmp_path: Path):
-        main(["chop", str(tmp_file), "--size", "1K", "--output-dir", str(tmp_path), "--quiet"])
-        first_part = tmp_path / "sample.bin.part0001"
+    def test_join_round_trip(self, chopped_parts: list[Path], sample_bytes: bytes, tmp_path: Path):
         out = tmp_path / "result.bin"
-        rc = main(["join", str(first_part), "--output", str(out), "--quiet"])
+        rc = main(["join", str(chopped_parts[0]), "--output", str(out), "--quiet"])
         assert rc == 0
-        assert out.read_bytes() == tmp_file.read_bytes()
+        assert out.read_bytes() == sample_bytes
 
-    def test_join_from_directory(self, tmp_file: Path, tmp_path: Path):
-        main(["chop", str(tmp_file), "--size", "1K", "--output-dir", str(tmp_path), "--quiet"])
+    def test_join_from_directory(self, chopped_parts: list[Path], tmp_path: Path):
         out = tmp_path / "result.bin"
         rc = main(["join", str(tmp_path), "--base", "sample.bin", "--output", str(out), "--quiet"])
         assert rc == 0
@@ -329,14 +820,72 @@ class TestCliJoin:
         rc = main(["join", str(tmp_path)])
         assert rc == 1
 
-    def test_join_missing_part_returns_nonzero(self, tmp_file: Path, tmp_path: Path):
-        main(["chop", str(tmp_file), "--size", "1K", "--output-dir", str(tmp_path), "--quiet"])
-        (tmp_path / "sample.bin.part0005").unlink()
-        first_part = tmp_path / "sample.bin.part0001"
+    def test_join_zero_jobs_returns_1(self, chopped_parts: list[Path]):
+        rc = main(["join", str(chopped_parts[0]), "--jobs", "0", "--quiet"])
+        assert rc == 1
+
+    def test_join_missing_part_returns_nonzero(self, chopped_parts: list[Path]):
+        chopped_parts[4].unlink()  # remove part 5
         # Auto-discovery skips the missing part → checksum mismatch → rc=2
-        rc = main(["join", str(first_part), "--quiet"])
+        rc = main(["join", str(chopped_parts[0]), "--quiet"])
         assert rc != 0
 
+    def test_join_part_below_regular_file_returns_1(self, tmp_file: Path, capsys):
+        rc = main(["join", str(tmp_file / "sample.bin.part0001"), "--quiet"])
+        assert rc == 1
+        assert "No part files found" in capsys.readouterr().err
+
+    def test_join_part_path_below_file_returns_1(self, tmp_file: Path, capsys):
+        parts = [str(tmp_file / "a.part0001"), str(tmp_file / "a.part0002")]
+        rc = main(["join", *parts, "--output", str(tmp_file.parent / "out.bin"), "--quiet"])
+        assert rc == 1
+        assert "Part file not found" in capsys.readouterr().err
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs POSIX symlinks")
+    def test_join_symlink_loop_part_returns_1(self, tmp_path: Path, capsys):
+        loop = tmp_path / "loop.bin.part0001"
+        loop.symlink_to(loop.name)
+        rc = main(["join", str(loop), str(loop), "--output", str(tmp_path / "out.bin"), "-q"])
+        assert rc == 1
+        assert "Part file not found" in capsys.readouterr().err
+
+    def test_join_unreadable_part_returns_1(
+        self, chopped_parts: list[Path], tmp_path: Path, monkeypatch, capsys
+    ):
+        real_stat = os.stat
+
+        def _stat(path, *args, **kwargs):
+            if Path(path) == chopped_parts[1]:
+                raise PermissionError(errno.EACCES, "Permission denied", str(path))
+            return real_stat(path, *args, **kwargs)
+
+        monkeypatch.setattr(os, "stat", _stat)
+        rc = main(["join", str(chopped_parts[0]), "--output", str(tmp_path / "out.bin"), "-q"])
+        assert rc == 1
+        assert "Cannot read part file" in capsys.readouterr().err
+
+    def test_join_reordered_parts_returns_2(self, tmp_file: Path, tmp_path: Path, capsys):
+        parts = chop(tmp_file, chunk_size=4000, output_dir=tmp_path, verify=True, jobs=2)
+        out = tmp_path / "out.bin"
+        rc = main(["join", str(parts[1]), str(parts[0]), str(parts[2]), "--output", str(out)])
+        assert rc == 2
+        assert "Joined order" in capsys.readouterr().err
+        assert not out.exists()
+
+    def test_join_duplicated_part_returns_2(self, tmp_file: Path, tmp_path: Path, capsys):
+        parts = chop(tmp_file, chunk_size=4000, output_dir=tmp_path, verify=True, jobs=2)
+        out = tmp_path / "out.bin"
+        rc = main(["join", str(parts[0]), *map(str, parts), "--output", str(out), "-q"])
+        assert rc == 2
+        assert "Joined order" in capsys.readouterr().err
+        assert not out.exists()
+
+    def test_join_rejects_directory_in_part_list(self, tmp_file: Path, tmp_path: Path, capsys):
+        parts = chop(tmp_file, chunk_size=3000, output_dir=tmp_path, verify=False)
+        rc = main(["join", str(parts[0]), str(tmp_path), "--output", str(tmp_path / "out.bin")])
+        assert rc == 1
+        assert "not a regular file" in capsys.readouterr().err
+
     def test_version(self, capsys):
         with pytest.raises(SystemExit) as exc_info:
             main(["--version"])
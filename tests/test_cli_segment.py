@@ -4,6 +4,10 @@ CLI tests for the 'segment' subcommand and remaining main.py coverage.
 
 from __future__ import annotations
 
+import errno
+import io
+import os
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
@@ -12,6 +16,11 @@ import pytest
 from file_chopper.main import main
 from file_chopper.segmenter import SegmentResult, SegmentStatus
 
+#: Fixture payloads, built once at import time.
+_LARGE_TXT = b"A" * 5_000
+# OLE2 Compound File Binary (CFB) header signature used by legacy .doc files
+_LARGE_DOC = b"\xd0\xcf\x11\xe0" + b"X" * 20_000
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -20,34 +29,41 @@ from file_chopper.segmenter import SegmentResult, SegmentStatus
 @pytest.fixture()
 def txt_file(tmp_path: Path) -> Path:
     p = tmp_path / "hello.txt"
-    p.write_text("Hello world!", encoding="utf-8")
+    p.write_bytes(b"Hello world!")
     return p
 
 
 @pytest.fixture()
 def large_txt_file(tmp_path: Path) -> Path:
     p = tmp_path / "large.txt"
-    p.write_text("A" * 5_000, encoding="utf-8")
+    p.write_bytes(_LARGE_TXT)
     return p
 
 
 @pytest.fixture()
 def large_doc_file(tmp_path: Path) -> Path:
     p = tmp_path / "large.doc"
-    # OLE2 Compound File Binary (CFB) header signature used by legacy .doc files
-    p.write_bytes(b"\xd0\xcf\x11\xe0" + b"X" * 20_000)
+    p.write_bytes(_LARGE_DOC)
     return p
 
 
-@pytest.fixture()
-def docx_file(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def docx_bytes() -> bytes:
+    """A ten-paragraph DOCX document, built and serialised once per session."""
     import docx
 
     doc = docx.Document()
     for _ in range(10):
         doc.add_paragraph("A" * 200)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture()
+def docx_file(tmp_path: Path, docx_bytes: bytes) -> Path:
     p = tmp_path / "doc.docx"
-    doc.save(str(p))
+    p.write_bytes(docx_bytes)
     return p
 
 
@@ -80,48 +96,40 @@ class TestCliSegmentHelp:
 
 
 class TestCliSegmentArgValidation:
-    def test_invalid_max_size_returns_2(self, txt_file: Path, tmp_path: Path):
-        rc = main(
-            [
-                "segment",
-                str(txt_file),
-                "--output-dir",
-                str(tmp_path / "out"),
-                "--max-size",
-                "notasize",
-            ]
-        )
+    @pytest.mark.parametrize(
+        "extra_args",
+        [
+            ["--max-size", "notasize"],
+            ["--max-size", "1MB", "--max-chars", "-1"],
+            ["--max-size", "1MB", "--max-chars", "0"],
+            ["--jobs", "0"],
+        ],
+        ids=["invalid-max-size", "negative-max-chars", "zero-max-chars", "zero-jobs"],
+    )
+    def test_invalid_option_returns_2(self, txt_file: Path, tmp_path: Path, extra_args):
+        out = tmp_path / "out"
+        rc = main(["segment", str(txt_file), "--output-dir", str(out), *extra_args])
         assert rc == 2
+        assert not out.exists()
 
-    def test_negative_max_chars_returns_2(self, txt_file: Path, tmp_path: Path):
-        rc = main(
-            [
-                "segment",
-                str(txt_file),
-                "--output-dir",
-                str(tmp_path / "out"),
-                "--max-size",
-                "1MB",
-                "--max-chars",
-                "-1",
-            ]
-        )
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs POSIX symlinks")
+    def test_symlink_loop_source_returns_2(self, tmp_path: Path, capsys):
+        loop = tmp_path / "loop.txt"
+        loop.symlink_to(loop.name)
+        rc = main(["segment", str(loop), "--output-dir", str(tmp_path / "out")])
         assert rc == 2
+        assert "Source not found" in capsys.readouterr().err
 
-    def test_zero_max_chars_returns_2(self, txt_file: Path, tmp_path: Path):
-        rc = main(
-            [
-                "segment",
-                str(txt_file),
-                "--output-dir",
-                str(tmp_path / "out"),
-                "--max-size",
-                "1MB",
-                "--max-chars",
-                "0",
-            ]
-        )
+    def test_unreadable_source_returns_2(self, txt_file: Path, tmp_path: Path, capsys):
+        def _stat(path, *args, **kwargs):
+            raise PermissionError(errno.EACCES, "Permission denied", str(path))
+
+        with patch.object(os, "stat", _stat):
+            rc = main(["segment", str(txt_file), "--output-dir", str(tmp_path / "out")])
         assert rc == 2
+        err = capsys.readouterr().err
+        assert "Cannot read source" in err
+        assert "Permission denied" in err
 
     def test_missing_source_returns_2(self, tmp_path: Path):
         rc = main(
@@ -208,43 +216,27 @@ class TestCliSegmentFile:
         )
         assert rc == 0
 
-    def test_missing_dep_exit_3(self, txt_file: Path, tmp_path: Path):
-        """Simulate a missing-dependency result → exit code 3."""
-        missing_dep_result = SegmentResult(
-            source=txt_file,
-            status=SegmentStatus.MISSING_DEP,
-            error_msg="pypdf is required",
-        )
-        with patch("file_chopper.main.segment_document", return_value=missing_dep_result):
-            rc = main(
-                [
-                    "segment",
-                    str(txt_file),
-                    "--output-dir",
-                    str(tmp_path / "out"),
-                    "--quiet",
-                ]
-            )
-        assert rc == 3
-
-    def test_error_result_exit_1(self, txt_file: Path, tmp_path: Path):
-        """Simulate an error result → exit code 1."""
-        error_result = SegmentResult(
-            source=txt_file,
-            status=SegmentStatus.ERROR,
-            error_msg="some error",
+    @pytest.mark.parametrize(
+        ("status", "expected_rc"),
+        [(SegmentStatus.MISSING_DEP, 3), (SegmentStatus.ERROR, 1)],
+        ids=["missing-dep-exit-3", "error-exit-1"],
+    )
+    def test_failed_result_exit_code(
+        self, txt_file: Path, tmp_path: Path, monkeypatch, status, expected_rc
+    ):
+        """Simulate a failed result: missing dependency → 3, other error → 1."""
+        result = SegmentResult(source=txt_file, status=status, error_msg="simulated failure")
+        monkeypatch.setattr("file_chopper.main.segment_document", lambda *args, **kwargs: result)
+        rc = main(
+            [
+                "segment",
+                str(txt_file),
+                "--output-dir",
+                str(tmp_path / "out"),
+                "--quiet",
+            ]
         )
-        with patch("file_chopper.main.segment_document", return_value=error_result):
-            rc = main(
-                [
-                    "segment",
-                    str(txt_file),
-                    "--output-dir",
-                    str(tmp_path / "out"),
-                    "--quiet",
-                ]
-            )
-        assert rc == 1
+        assert rc == expected_rc
 
 
 # ---------------------------------------------------------------------------
@@ -256,8 +248,8 @@ class TestCliSegmentDirectory:
     def test_directory_exit_0(self, tmp_path: Path):
         input_dir = tmp_path / "docs"
         input_dir.mkdir()
-        (input_dir / "a.txt").write_text("hello", encoding="utf-8")
-        (input_dir / "b.txt").write_text("world", encoding="utf-8")
+        (input_dir / "a.txt").write_bytes(b"hello")
+        (input_dir / "b.txt").write_bytes(b"world")
         out = tmp_path / "out"
 
         rc = main(
@@ -274,7 +266,7 @@ class TestCliSegmentDirectory:
     def test_directory_files_processed(self, tmp_path: Path):
         input_dir = tmp_path / "docs"
         input_dir.mkdir()
-        (input_dir / "a.txt").write_text("hello", encoding="utf-8")
+        (input_dir / "a.txt").write_bytes(b"hello")
         out = tmp_path / "out"
 
         main(
@@ -288,6 +280,18 @@ class TestCliSegmentDirectory:
         )
         assert (out / "a.txt").exists()
 
+    def test_directory_parallel_jobs(self, tmp_path: Path):
+        input_dir = tmp_path / "docs"
+        input_dir.mkdir()
+        (input_dir / "a.txt").write_bytes(b"hello")
+        (input_dir / "b.txt").write_bytes(b"world")
+        out = tmp_path / "out"
+
+        rc = main(["segment", str(input_dir), "--output-dir", str(out), "-j", "2", "--quiet"])
+        assert rc == 0
+        assert (out / "a.txt").exists()
+        assert (out / "b.txt").exists()
+
     def test_directory_with_error_exits_1(self, tmp_path: Path):
         input_dir = tmp_path / "docs"
         input_dir.mkdir()
@@ -312,7 +316,7 @@ class TestCliSegmentDirectory:
         input_dir = tmp_path / "docs"
         input_dir.mkdir()
         (input_dir / "aaa.doc").write_bytes(b"X" * 20_000)
-        (input_dir / "zzz.txt").write_text("ok", encoding="utf-8")
+        (input_dir / "zzz.txt").write_bytes(b"ok")
         out = tmp_path / "out"
 
         rc = main(
@@ -333,7 +337,7 @@ class TestCliSegmentDirectory:
     def test_directory_verbose_output(self, tmp_path: Path, capsys):
         input_dir = tmp_path / "docs"
         input_dir.mkdir()
-        (input_dir / "a.txt").write_text("hello", encoding="utf-8")
+        (input_dir / "a.txt").write_bytes(b"hello")
         out = tmp_path / "out"
 
         main(
@@ -396,6 +400,16 @@ class TestCliEntryPoint:
             cli()
         assert exc_info.value.code == 0
 
+    def test_parser_shared_between_calls(self):
+        from file_chopper.main import _build_parser
+
+        parser = _build_parser()
+        assert _build_parser() is parser
+        first = parser.parse_args(["segment", "a", "--output-dir", "x", "-j", "3"])
+        second = parser.parse_args(["segment", "b", "--output-dir", "y"])
+        assert (first.source, first.jobs) == ("a", 3)
+        assert (second.source, second.jobs) == ("b", 1)
+
 
 # ---------------------------------------------------------------------------
 # CLI: chop verbose output (uncovered lines in _cmd_chop)
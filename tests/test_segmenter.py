@@ -4,6 +4,12 @@ Unit tests for file_chopper.segmenter
 
 from __future__ import annotations
 
+import datetime
+import io
+import os
+import shutil
+import stat
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
@@ -14,14 +20,18 @@ from file_chopper.segmenter import (
     SUPPORTED_FORMATS,
     SegmentResult,
     SegmentStatus,
-    _collect_odf_text,
-    _split_text_into_chunks,
     extract_text,
+    iter_text,
     needs_split,
     segment_document,
     segment_folder,
 )
 
+#: Fixture payloads, built once at import time.
+_LARGE_TXT = b"A" * 200_000
+# Out-of-scope .doc payload larger than the 10 000-byte limit the tests use
+_LARGE_DOC = b"X" * 20_000
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -30,58 +40,74 @@ from file_chopper.segmenter import (
 @pytest.fixture()
 def txt_file(tmp_path: Path) -> Path:
     p = tmp_path / "hello.txt"
-    p.write_text("Hello, world!", encoding="utf-8")
+    p.write_bytes(b"Hello, world!")
     return p
 
 
 @pytest.fixture()
 def large_txt_file(tmp_path: Path) -> Path:
     p = tmp_path / "large.txt"
-    p.write_text("A" * 200_000, encoding="utf-8")
+    p.write_bytes(_LARGE_TXT)
     return p
 
 
 @pytest.fixture()
 def html_file(tmp_path: Path) -> Path:
     p = tmp_path / "page.html"
-    p.write_text(
-        "<html><head><title>T</title></head><body>"
-        "<script>alert(1)</script>"
-        "<style>body{}</style>"
-        "<p>Hello HTML</p>"
-        "</body></html>",
-        encoding="utf-8",
+    p.write_bytes(
+        b"<html><head><title>T</title></head><body>"
+        b"<script>alert(1)</script>"
+        b"<style>body{}</style>"
+        b"<p>Hello HTML</p>"
+        b"</body></html>"
     )
     return p
 
 
-@pytest.fixture()
-def docx_file(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def docx_bytes() -> bytes:
+    """A two-paragraph DOCX document, built and serialised once per session."""
     import docx
 
     doc = docx.Document()
     doc.add_paragraph("First paragraph")
     doc.add_paragraph("Second paragraph")
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture()
+def docx_file(tmp_path: Path, docx_bytes: bytes) -> Path:
     p = tmp_path / "test.docx"
-    doc.save(str(p))
+    p.write_bytes(docx_bytes)
     return p
 
 
-@pytest.fixture()
-def pptx_file(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def pptx_bytes() -> bytes:
+    """A one-slide PPTX presentation, built and serialised once per session."""
     from pptx import Presentation
 
     prs = Presentation()
     slide = prs.slides.add_slide(prs.slide_layouts[1])
     slide.shapes.title.text = "Slide Title"
     slide.placeholders[1].text = "Slide content"
+    buf = io.BytesIO()
+    prs.save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture()
+def pptx_file(tmp_path: Path, pptx_bytes: bytes) -> Path:
     p = tmp_path / "test.pptx"
-    prs.save(str(p))
+    p.write_bytes(pptx_bytes)
     return p
 
 
-@pytest.fixture()
-def xlsx_file(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def xlsx_bytes() -> bytes:
+    """A two-row XLSX workbook, built and serialised once per session."""
     import openpyxl
 
     wb = openpyxl.Workbook()
@@ -90,21 +116,36 @@ def xlsx_file(tmp_path: Path) -> Path:
     ws["B1"] = "Value"
     ws["A2"] = "Alpha"
     ws["B2"] = 42
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture()
+def xlsx_file(tmp_path: Path, xlsx_bytes: bytes) -> Path:
     p = tmp_path / "test.xlsx"
-    wb.save(str(p))
+    p.write_bytes(xlsx_bytes)
     return p
 
 
-@pytest.fixture()
-def odt_file(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def odt_bytes() -> bytes:
+    """A one-paragraph ODT document, built and serialised once per session."""
     from odf.opendocument import OpenDocumentText
     from odf.text import P
 
     doc = OpenDocumentText()
     para = P(text="ODT paragraph content")
     doc.text.addElement(para)
+    buf = io.BytesIO()
+    doc.write(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture()
+def odt_file(tmp_path: Path, odt_bytes: bytes) -> Path:
     p = tmp_path / "test.odt"
-    doc.save(str(p))
+    p.write_bytes(odt_bytes)
     return p
 
 
@@ -119,47 +160,85 @@ def rtf_file(tmp_path: Path) -> Path:
     return p
 
 
-@pytest.fixture()
-def pdf_file(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def pdf_bytes() -> bytes:
+    """A blank one-page PDF, built and serialised once per session."""
     from pypdf import PdfWriter
 
     writer = PdfWriter()
     writer.add_blank_page(width=72, height=72)
-    p = tmp_path / "test.pdf"
-    with p.open("wb") as fh:
-        writer.write(fh)
-    return p
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
 
 
-# ---------------------------------------------------------------------------
-# Format sets
-# ---------------------------------------------------------------------------
+@pytest.fixture()
+def pdf_file(tmp_path: Path, pdf_bytes: bytes) -> Path:
+    p = tmp_path / "test.pdf"
+    p.write_bytes(pdf_bytes)
+    return p
 
 
-class TestFormatSets:
-    def test_doc_in_out_of_scope(self):
-        assert ".doc" in OUT_OF_SCOPE_FORMATS
+@pytest.fixture(scope="session")
+def text_pdf_bytes() -> bytes:
+    """A two-page PDF with real text, built and serialised once per session."""
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
 
-    def test_ppt_in_out_of_scope(self):
-        assert ".ppt" in OUT_OF_SCOPE_FORMATS
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for number in (1, 2):
+        page = writer.add_blank_page(width=200, height=200)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        content = DecodedStreamObject()
+        content.set_data(
+            b"BT /F1 12 Tf 10 150 Td (Page %d text) Tj 0 -20 Td (Second line) Tj ET" % number
+        )
+        page[NameObject("/Contents")] = writer._add_object(content)
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
 
-    def test_xls_in_out_of_scope(self):
-        assert ".xls" in OUT_OF_SCOPE_FORMATS
 
-    def test_docx_in_supported(self):
-        assert ".docx" in SUPPORTED_FORMATS
+@pytest.fixture()
+def text_pdf_file(tmp_path: Path, text_pdf_bytes: bytes) -> Path:
+    p = tmp_path / "text.pdf"
+    p.write_bytes(text_pdf_bytes)
+    return p
 
-    def test_pdf_in_supported(self):
-        assert ".pdf" in SUPPORTED_FORMATS
 
-    def test_txt_in_supported(self):
-        assert ".txt" in SUPPORTED_FORMATS
+# ---------------------------------------------------------------------------
+# Format sets
+# ---------------------------------------------------------------------------
 
-    def test_html_in_supported(self):
-        assert ".html" in SUPPORTED_FORMATS
 
-    def test_htm_in_supported(self):
-        assert ".htm" in SUPPORTED_FORMATS
+class TestFormatSets:
+    @pytest.mark.parametrize(
+        ("ext", "out_of_scope"),
+        [
+            (".doc", True),
+            (".ppt", True),
+            (".xls", True),
+            (".docx", False),
+            (".pdf", False),
+            (".txt", False),
+            (".html", False),
+            (".htm", False),
+        ],
+    )
+    def test_format_membership(self, ext: str, out_of_scope: bool):
+        assert (ext in OUT_OF_SCOPE_FORMATS) is out_of_scope
+        assert (ext in SUPPORTED_FORMATS) is not out_of_scope
 
 
 # ---------------------------------------------------------------------------
@@ -195,9 +274,20 @@ class TestExtractText:
         text = extract_text(html_file)
         assert "body{}" not in text
 
+    def test_html_without_selectolax(self, html_file: Path):
+        with patch.dict("sys.modules", {"selectolax.lexbor": None}):
+            text = extract_text(html_file)
+        assert text == "THello HTML"
+
+    def test_html_selectolax_matches_stdlib(self, html_file: Path):
+        pytest.importorskip("selectolax.lexbor")
+        fast = extract_text(html_file)
+        with patch.dict("sys.modules", {"selectolax.lexbor": None}):
+            assert extract_text(html_file) == fast
+
     def test_htm_extension(self, tmp_path: Path):
         p = tmp_path / "page.htm"
-        p.write_text("<html><body><p>HTM content</p></body></html>", encoding="utf-8")
+        p.write_bytes(b"<html><body><p>HTM content</p></body></html>")
         assert "HTM content" in extract_text(p)
 
     def test_docx_extraction(self, docx_file: Path):
@@ -214,14 +304,55 @@ class TestExtractText:
         assert "Name" in text
         assert "Alpha" in text
 
+    def test_xlsx_without_calamine(self, xlsx_file: Path):
+        with patch.dict("sys.modules", {"python_calamine": None}):
+            text = extract_text(xlsx_file)
+        assert text == "Name\tValue\nAlpha\t42"
+
+    def test_xlsx_calamine_matches_openpyxl(self, tmp_path: Path):
+        pytest.importorskip("python_calamine")
+        import openpyxl
+
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws["C2"] = "offset"
+        ws["A3"] = 1
+        ws["B3"] = 2.5
+        ws["C3"] = True
+        ws["D3"] = datetime.datetime(2024, 1, 2, 3, 4, 5)
+        ws["E3"] = datetime.date(2024, 1, 2)
+        wb.create_sheet("Second")["A1"] = "second sheet"
+        p = tmp_path / "mixed.xlsx"
+        wb.save(str(p))
+        fast = extract_text(p)
+        with patch.dict("sys.modules", {"python_calamine": None}):
+            assert extract_text(p) == fast
+
     def test_odt_extraction(self, odt_file: Path):
         text = extract_text(odt_file)
         assert "ODT paragraph" in text
 
+    def test_odf_skips_elements_teletype_cannot_handle(self, odt_file: Path):
+        from odf import teletype
+
+        with patch.object(teletype, "extractText", side_effect=AttributeError("bad node")):
+            assert extract_text(odt_file) == ""
+
     def test_rtf_extraction(self, rtf_file: Path):
         text = extract_text(rtf_file)
         assert "Hello RTF" in text
 
+    def test_pdf_without_pypdfium2(self, text_pdf_file: Path):
+        with patch.dict("sys.modules", {"pypdfium2": None}):
+            text = extract_text(text_pdf_file)
+        assert text == "Page 1 text\nSecond line\nPage 2 text\nSecond line"
+
+    def test_pdf_pypdfium2_matches_pypdf(self, text_pdf_file: Path):
+        pytest.importorskip("pypdfium2")
+        fast = extract_text(text_pdf_file)
+        with patch.dict("sys.modules", {"pypdfium2": None}):
+            assert extract_text(text_pdf_file) == fast
+
     def test_pdf_extraction(self, pdf_file: Path):
         # blank PDF page — just verify it runs without error
         text = extract_text(pdf_file)
@@ -236,7 +367,8 @@ class TestExtractText:
     def test_missing_pypdf_raises_import_error(self, tmp_path: Path):
         p = tmp_path / "file.pdf"
         p.write_bytes(b"%PDF-1.4")
-        with patch.dict("sys.modules", {"pypdf": None}), pytest.raises(ImportError, match="pypdf"):
+        modules = {"pypdf": None, "pypdfium2": None}
+        with patch.dict("sys.modules", modules), pytest.raises(ImportError, match="pypdf"):
             from file_chopper.segmenter import _extract_pdf_text
 
             _extract_pdf_text(p)
@@ -260,7 +392,8 @@ class TestExtractText:
     def test_missing_openpyxl_raises_import_error(self, tmp_path: Path):
         p = tmp_path / "file.xlsx"
         p.write_bytes(b"PK")
-        with patch.dict("sys.modules", {"openpyxl": None}), pytest.raises(ImportError, match="openpyxl"):
+        modules = {"openpyxl": None, "python_calamine": None}
+        with patch.dict("sys.modules", modules), pytest.raises(ImportError, match="openpyxl"):
             from file_chopper.segmenter import _extract_xlsx_text
 
             _extract_xlsx_text(p)
@@ -285,21 +418,60 @@ class TestExtractText:
 
 
 # ---------------------------------------------------------------------------
-# _collect_odf_text
+# iter_text
 # ---------------------------------------------------------------------------
 
 
-class TestCollectOdfText:
-    def test_handles_exception_gracefully(self):
-        """_collect_odf_text should not raise when teletype fails."""
-
-        class _FakeNode:
-            pass
-
-        parts: list = []
-        # Should not raise even with an object that has no compatible interface
-        _collect_odf_text(_FakeNode(), parts)
-        # May or may not append content — just must not raise
+class TestIterText:
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            "txt_file",
+            "html_file",
+            "docx_file",
+            "pptx_file",
+            "xlsx_file",
+            "odt_file",
+            "rtf_file",
+            "pdf_file",
+        ],
+    )
+    def test_pieces_join_to_extract_text(self, fixture: str, request):
+        path = request.getfixturevalue(fixture)
+        assert "".join(iter_text(path)) == extract_text(path)
+
+    def test_plain_text_read_in_blocks(self, large_txt_file: Path, monkeypatch):
+        import file_chopper.segmenter as segmenter_mod
+
+        monkeypatch.setattr(segmenter_mod, "_PLAIN_TEXT_BLOCK", 64 * 1024)
+        pieces = list(iter_text(large_txt_file))
+        assert len(pieces) == 4
+        assert "".join(pieces) == _LARGE_TXT.decode("ascii")
+
+    def test_plain_text_blocks_split_inside_characters(self, tmp_path: Path, monkeypatch):
+        import file_chopper.segmenter as segmenter_mod
+
+        p = tmp_path / "umlauts.txt"
+        text = "äöü€\r\n" * 1_000
+        p.write_bytes(text.encode("utf-8"))
+        monkeypatch.setattr(segmenter_mod, "_PLAIN_TEXT_BLOCK", 7)
+        expected = p.read_text(encoding="utf-8")
+        assert "".join(iter_text(p)) == expected
+        assert extract_text(p) == expected
+
+    def test_plain_text_mixed_newlines_and_bad_bytes(self, tmp_path: Path):
+        p = tmp_path / "mixed.txt"
+        data = b"a\r\nb\rc\n\xff\r\r\n\xe2\x82"
+        p.write_bytes(data)
+        expected = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", errors="replace").read()
+        assert extract_text(p) == expected
+        assert "".join(iter_text(p)) == expected
+
+    def test_plain_text_empty_file(self, tmp_path: Path):
+        p = tmp_path / "empty.txt"
+        p.write_bytes(b"")
+        assert extract_text(p) == ""
+        assert list(iter_text(p)) == []
 
 
 # ---------------------------------------------------------------------------
@@ -323,13 +495,12 @@ class TestNeedsSplit:
         )
 
     def test_preextracted_text_used(self, txt_file: Path):
-        # precomputed long text should trigger split
-        long_text = "X" * 1_000_000
+        # precomputed text one character over the limit should trigger split
         assert needs_split(
             txt_file,
             max_child_bytes=1_000_000,
             max_child_text_chars=100,
-            _text=long_text,
+            _text="X" * 101,
         )
 
     def test_preextracted_text_short_no_split(self, txt_file: Path):
@@ -346,33 +517,14 @@ class TestNeedsSplit:
         p.write_bytes(b"data")
         assert not needs_split(p, max_child_bytes=1_000_000, max_child_text_chars=100_000)
 
+    def test_stops_extracting_once_text_is_too_long(self, txt_file: Path):
+        def _pieces():
+            yield "A" * 60
+            yield "B" * 60
+            raise AssertionError("read past the limit")
 
-# ---------------------------------------------------------------------------
-# _split_text_into_chunks
-# ---------------------------------------------------------------------------
-
-
-class TestSplitTextIntoChunks:
-    def test_single_chunk_when_fits(self):
-        result = _split_text_into_chunks("hello", 100)
-        assert result == ["hello"]
-
-    def test_splits_evenly(self):
-        result = _split_text_into_chunks("ABCDEF", 2)
-        assert result == ["AB", "CD", "EF"]
-
-    def test_last_chunk_smaller(self):
-        result = _split_text_into_chunks("ABCDE", 2)
-        assert result == ["AB", "CD", "E"]
-
-    def test_empty_string_produces_no_chunks(self):
-        result = _split_text_into_chunks("", 100)
-        assert result == []
-
-    def test_total_reconstructs_original(self):
-        text = "X" * 1_000_007
-        chunks = _split_text_into_chunks(text, 1_000)
-        assert "".join(chunks) == text
+        with patch("file_chopper.segmenter.iter_text", return_value=_pieces()):
+            assert needs_split(txt_file, max_child_bytes=1_000_000, max_child_text_chars=100)
 
 
 # ---------------------------------------------------------------------------
@@ -383,31 +535,51 @@ class TestSplitTextIntoChunks:
 class TestSegmentDocument:
     # ---- out-of-scope, no split ----
 
-    def test_doc_small_copied(self, tmp_path: Path):
-        doc = tmp_path / "small.doc"
-        doc.write_bytes(b"DOCBIN" * 10)
-        out = tmp_path / "out"
-        result = segment_document(doc, out, max_child_bytes=10_000, max_child_text_chars=50_000)
-        assert result.status == SegmentStatus.OK
-        assert (out / "small.doc").read_bytes() == doc.read_bytes()
-
-    def test_ppt_small_copied(self, tmp_path: Path):
-        f = tmp_path / "slides.ppt"
-        f.write_bytes(b"X" * 100)
+    @pytest.mark.parametrize(
+        ("name", "payload"),
+        [("small.doc", b"DOCBIN" * 10), ("slides.ppt", b"X" * 100), ("data.xls", b"X" * 100)],
+    )
+    def test_out_of_scope_small_copied(self, tmp_path: Path, name: str, payload: bytes):
+        f = tmp_path / name
+        f.write_bytes(payload)
         out = tmp_path / "out"
         result = segment_document(f, out, max_child_bytes=10_000, max_child_text_chars=50_000)
         assert result.status == SegmentStatus.OK
+        assert (out / name).read_bytes() == payload
 
-    def test_xls_small_copied(self, tmp_path: Path):
-        f = tmp_path / "data.xls"
-        f.write_bytes(b"X" * 100)
+    def test_small_copy_keeps_mtime_and_mode(self, tmp_path: Path):
+        f = tmp_path / "small.doc"
+        f.write_bytes(b"DOCBIN" * 10)
+        f.chmod(0o640)
+        os.utime(f, ns=(1_500_000_000_000_000_000, 1_600_000_000_000_000_000))
         out = tmp_path / "out"
         result = segment_document(f, out, max_child_bytes=10_000, max_child_text_chars=50_000)
         assert result.status == SegmentStatus.OK
+        src_st, dst_st = f.stat(), (out / "small.doc").stat()
+        assert dst_st.st_mtime_ns == src_st.st_mtime_ns
+        assert stat.S_IMODE(dst_st.st_mode) == stat.S_IMODE(src_st.st_mode)
+
+    @pytest.mark.parametrize("name", ["small.doc", "notes.txt", "data.xyz"])
+    def test_copy_onto_itself_keeps_source(self, tmp_path: Path, name: str):
+        f = tmp_path / name
+        f.write_bytes(b"keep me")
+        with pytest.raises(shutil.SameFileError):
+            segment_document(f, tmp_path, max_child_bytes=10_000, max_child_text_chars=50_000)
+        assert f.read_bytes() == b"keep me"
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs os.mkfifo")
+    @pytest.mark.parametrize("name", ["small.doc", "data.xyz"])
+    def test_fifo_source_is_refused(self, tmp_path: Path, name: str):
+        fifo = tmp_path / name
+        os.mkfifo(fifo)
+        out = tmp_path / "out"
+        with pytest.raises(shutil.SpecialFileError):
+            segment_document(fifo, out, max_child_bytes=10_000, max_child_text_chars=50_000)
+        assert not (out / name).exists()
 
     def test_doc_large_error(self, tmp_path: Path):
         doc = tmp_path / "large.doc"
-        doc.write_bytes(b"X" * 20_000)
+        doc.write_bytes(_LARGE_DOC)
         out = tmp_path / "out"
         result = segment_document(doc, out, max_child_bytes=10_000, max_child_text_chars=50_000)
         assert result.status == SegmentStatus.ERROR
@@ -423,24 +595,27 @@ class TestSegmentDocument:
         assert result.status == SegmentStatus.OK
         assert len(result.children) == 1
 
-    # ---- supported formats, no split ----
-
-    def test_txt_small_copied(self, txt_file: Path, tmp_path: Path):
+    def test_unknown_format_copied_byte_for_byte(self, tmp_path: Path):
+        f = tmp_path / "data.bin"
+        data = bytes(range(256)) * 4_099
+        f.write_bytes(data)
         out = tmp_path / "out"
-        result = segment_document(
-            txt_file, out, max_child_bytes=10_000, max_child_text_chars=50_000
-        )
-        assert result.status == SegmentStatus.OK
-        assert len(result.children) == 1
-        assert result.children[0].suffix == ".txt"
+        result = segment_document(f, out, max_child_bytes=10_000_000, max_child_text_chars=50_000)
+        assert result.children == [out / "data.bin"]
+        assert result.children[0].read_bytes() == data
 
-    def test_html_small_copied(self, html_file: Path, tmp_path: Path):
+    # ---- supported formats, no split ----
+
+    @pytest.mark.parametrize("fixture", ["txt_file", "html_file"])
+    def test_small_supported_copied(self, fixture: str, request, tmp_path: Path):
+        path = request.getfixturevalue(fixture)
         out = tmp_path / "out"
         result = segment_document(
-            html_file, out, max_child_bytes=10_000, max_child_text_chars=50_000
+            path, out, max_child_bytes=10_000, max_child_text_chars=50_000
         )
         assert result.status == SegmentStatus.OK
         assert len(result.children) == 1
+        assert result.children[0].suffix == path.suffix
 
     # ---- supported formats, split ----
 
@@ -457,7 +632,7 @@ class TestSegmentDocument:
 
     def test_txt_split_by_file_size(self, tmp_path: Path):
         f = tmp_path / "medium.txt"
-        f.write_text("Hello world", encoding="utf-8")
+        f.write_bytes(b"Hello world")
         out = tmp_path / "out"
         # Force split by file size (even though text is short)
         result = segment_document(f, out, max_child_bytes=1, max_child_text_chars=50_000)
@@ -481,15 +656,94 @@ class TestSegmentDocument:
         result = segment_document(f, out, max_child_bytes=1, max_child_text_chars=50_000)
         assert result.status == SegmentStatus.ERROR
 
-    def test_missing_dep_returns_missing_dep_status(self, tmp_path: Path):
+    def test_missing_dep_returns_missing_dep_status(self, tmp_path: Path, monkeypatch):
         """If a required library is missing, result has MISSING_DEP status."""
         f = tmp_path / "file.pdf"
         f.write_bytes(b"%PDF-1.4 minimal")
         out = tmp_path / "out"
-        with patch("file_chopper.segmenter.extract_text", side_effect=ImportError("pypdf missing")):
-            result = segment_document(f, out, max_child_bytes=1, max_child_text_chars=50_000)
+
+        def _missing(path):
+            raise ImportError("pypdf missing")
+
+        monkeypatch.setattr("file_chopper.segmenter.iter_text", _missing)
+        result = segment_document(f, out, max_child_bytes=1, max_child_text_chars=50_000)
         assert result.status == SegmentStatus.MISSING_DEP
 
+    def test_known_size_is_not_restatted(self, tmp_path: Path):
+        f = tmp_path / "doc.txt"
+        f.write_bytes(b"A" * 50)
+        # The size given by the caller decides the split, not the file's.
+        result = segment_document(
+            f, tmp_path / "out", max_child_bytes=10_000, max_child_text_chars=100, size=20_000
+        )
+        assert result.children == [tmp_path / "out" / "doc_part0001.txt"]
+
+    # ---- streamed extraction ----
+
+    def test_streamed_pieces_split_at_exact_boundaries(self, tmp_path: Path):
+        f = tmp_path / "doc.txt"
+        f.write_bytes(b"x")
+        text = "abc" * 70  # pieces straddle the 100-char child boundaries
+        with patch("file_chopper.segmenter.iter_text", return_value=iter(["abc"] * 70)):
+            result = segment_document(f, tmp_path / "out", 10_000, max_child_text_chars=100)
+        assert [c.read_text(encoding="utf-8") for c in result.children] == [
+            text[:100],
+            text[100:200],
+            text[200:],
+        ]
+
+    def test_single_piece_split_evenly(self, tmp_path: Path):
+        f = tmp_path / "doc.txt"
+        f.write_bytes(b"x")
+        with patch("file_chopper.segmenter.iter_text", return_value=iter(["ABCDEF"])):
+            result = segment_document(f, tmp_path / "out", 10_000, max_child_text_chars=2)
+        assert [c.read_text(encoding="utf-8") for c in result.children] == ["AB", "CD", "EF"]
+
+    def test_single_piece_last_child_smaller(self, tmp_path: Path):
+        f = tmp_path / "doc.txt"
+        f.write_bytes(b"x")
+        with patch("file_chopper.segmenter.iter_text", return_value=iter(["ABCDE"])):
+            result = segment_document(f, tmp_path / "out", 10_000, max_child_text_chars=2)
+        assert [c.read_text(encoding="utf-8") for c in result.children] == ["AB", "CD", "E"]
+
+    def test_children_written_like_write_text(self, tmp_path: Path):
+        f = tmp_path / "doc.txt"
+        f.write_bytes(b"x")
+        text = "zeile ä\nline €\n" * 10
+        with patch("file_chopper.segmenter.iter_text", return_value=iter([text])):
+            result = segment_document(f, tmp_path / "out", 10_000, max_child_text_chars=50)
+        reference = tmp_path / "reference.txt"
+        for i, child in enumerate(result.children):
+            reference.write_text(text[i * 50 : (i + 1) * 50], encoding="utf-8")
+            assert child.read_bytes() == reference.read_bytes()
+
+    def test_children_reconstruct_original(self, tmp_path: Path):
+        f = tmp_path / "doc.txt"
+        text = "X" * 1_000_007
+        f.write_text(text, encoding="utf-8")
+        result = segment_document(f, tmp_path / "out", 10_000_000, max_child_text_chars=1_000)
+        assert len(result.children) == 1_001
+        # Compare child by child rather than building a second 1 MB string.
+        assert all(
+            child.read_text(encoding="utf-8") == text[start : start + 1_000]
+            for start, child in zip(range(0, len(text), 1_000), result.children)
+        )
+
+    def test_failure_midway_removes_written_children(self, tmp_path: Path):
+        f = tmp_path / "doc.txt"
+        f.write_bytes(b"x")
+        out = tmp_path / "out"
+
+        def _pieces():
+            yield "a" * 250
+            raise RuntimeError("corrupt page")
+
+        with patch("file_chopper.segmenter.iter_text", return_value=_pieces()):
+            result = segment_document(f, out, 10_000, max_child_text_chars=100)
+        assert result.status == SegmentStatus.ERROR
+        assert "corrupt page" in result.error_msg
+        assert list(out.iterdir()) == []
+
     # ---- ods/odp variants ----
 
     def test_odp_extraction_via_extract_text(self, tmp_path: Path):
@@ -524,22 +778,23 @@ class TestSegmentDocument:
 
 
 class TestSegmentFolder:
-    def test_processes_multiple_files(self, tmp_path: Path):
+    @pytest.mark.parametrize("count", [1, 3])
+    def test_processes_multiple_files(self, tmp_path: Path, count: int):
         input_dir = tmp_path / "input"
         input_dir.mkdir()
-        for name in ("a.txt", "b.txt", "c.txt"):
-            (input_dir / name).write_text("hello", encoding="utf-8")
+        for name in ("a.txt", "b.txt", "c.txt")[:count]:
+            (input_dir / name).write_bytes(b"hello")
         output_dir = tmp_path / "output"
 
         results = segment_folder(input_dir, output_dir, 10_000, 50_000)
-        assert len(results) == 3
+        assert len(results) == count
         assert all(r.status == SegmentStatus.OK for r in results)
 
     def test_mirrors_directory_structure(self, tmp_path: Path):
         input_dir = tmp_path / "input"
         sub = input_dir / "sub"
         sub.mkdir(parents=True)
-        (sub / "nested.txt").write_text("nested content", encoding="utf-8")
+        (sub / "nested.txt").write_bytes(b"nested content")
         output_dir = tmp_path / "output"
 
         segment_folder(input_dir, output_dir, 10_000, 50_000)
@@ -551,24 +806,113 @@ class TestSegmentFolder:
         results = segment_folder(input_dir, tmp_path / "out", 10_000, 50_000)
         assert results == []
 
+    def test_missing_directory_returns_empty(self, tmp_path: Path):
+        results = segment_folder(tmp_path / "ghost", tmp_path / "out", 10_000, 50_000)
+        assert results == []
+
     def test_fail_fast_stops_at_first_error(self, tmp_path: Path):
         input_dir = tmp_path / "input"
         input_dir.mkdir()
         # Error file first (alphabetically)
-        (input_dir / "aaa.doc").write_bytes(b"X" * 20_000)
-        (input_dir / "zzz.txt").write_text("ok", encoding="utf-8")
+        (input_dir / "aaa.doc").write_bytes(_LARGE_DOC)
+        (input_dir / "zzz.txt").write_bytes(b"ok")
         results = segment_folder(input_dir, tmp_path / "out", 10_000, 50_000, fail_fast=True)
         assert len(results) == 1
         assert results[0].status == SegmentStatus.ERROR
 
+    def test_fail_fast_stops_walking_the_tree(self, tmp_path: Path):
+        input_dir = tmp_path / "input"
+        (input_dir / "a").mkdir(parents=True)
+        (input_dir / "b").mkdir()
+        (input_dir / "a" / "bad.doc").write_bytes(_LARGE_DOC)
+        (input_dir / "b" / "ok.txt").write_bytes(b"ok")
+        listed = []
+        real_scandir = os.scandir
+
+        def _scandir(path):
+            listed.append(Path(path))
+            return real_scandir(path)
+
+        with patch("file_chopper.segmenter.os.scandir", side_effect=_scandir):
+            results = segment_folder(input_dir, tmp_path / "out", 10_000, 50_000, fail_fast=True)
+        assert [r.status for r in results] == [SegmentStatus.ERROR]
+        assert input_dir / "b" not in listed
+
+    @pytest.mark.skipif(
+        sys.platform == "win32" or os.geteuid() == 0,
+        reason="needs POSIX permissions that apply to the current user",
+    )
+    def test_unreadable_subdirectory_skipped(self, tmp_path: Path):
+        input_dir = tmp_path / "input"
+        locked = input_dir / "locked"
+        locked.mkdir(parents=True)
+        (locked / "hidden.txt").write_bytes(b"hidden")
+        (input_dir / "zzz.txt").write_bytes(b"ok")
+        locked.chmod(0)
+        try:
+            results = segment_folder(input_dir, tmp_path / "out", 10_000, 50_000)
+        finally:
+            locked.chmod(0o755)
+        assert [r.source for r in results] == [input_dir / "zzz.txt"]
+
+    def test_unlistable_subdirectory_skipped(self, tmp_path: Path):
+        input_dir = tmp_path / "input"
+        (input_dir / "locked").mkdir(parents=True)
+        (input_dir / "locked" / "hidden.txt").write_bytes(b"hidden")
+        (input_dir / "zzz.txt").write_bytes(b"ok")
+        real_scandir = os.scandir
+
+        def _scandir(path):
+            if Path(path).name == "locked":
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        with patch("file_chopper.segmenter.os.scandir", side_effect=_scandir):
+            results = segment_folder(input_dir, tmp_path / "out", 10_000, 50_000)
+        assert [r.source for r in results] == [input_dir / "zzz.txt"]
+        assert results[0].status == SegmentStatus.OK
+
     def test_no_fail_fast_processes_all(self, tmp_path: Path):
         input_dir = tmp_path / "input"
         input_dir.mkdir()
-        (input_dir / "aaa.doc").write_bytes(b"X" * 20_000)
-        (input_dir / "zzz.txt").write_text("ok", encoding="utf-8")
+        (input_dir / "aaa.doc").write_bytes(_LARGE_DOC)
+        (input_dir / "zzz.txt").write_bytes(b"ok")
         results = segment_folder(input_dir, tmp_path / "out", 10_000, 50_000, fail_fast=False)
         assert len(results) == 2
 
+    def test_files_processed_in_sorted_path_order(self, tmp_path: Path):
+        input_dir = tmp_path / "input"
+        for name in ("b.txt", "a/z.txt", "a/b/y.txt", "a.txt", "a-x.txt", "c/x.txt"):
+            (input_dir / name).parent.mkdir(parents=True, exist_ok=True)
+            (input_dir / name).write_bytes(b"hello")
+        (input_dir / "empty").mkdir()
+        results = segment_folder(input_dir, tmp_path / "out", 10_000, 50_000)
+        expected = sorted(p for p in input_dir.rglob("*") if p.is_file())
+        assert [r.source for r in results] == expected
+
+    def test_parallel_matches_sequential(self, tmp_path: Path):
+        input_dir = tmp_path / "input"
+        (input_dir / "sub").mkdir(parents=True)
+        for name in ("a.txt", "b.txt", "sub/c.txt", "sub/d.doc"):
+            (input_dir / name).write_text(name * 100, encoding="utf-8")
+        seq = segment_folder(input_dir, tmp_path / "seq", 100, 50_000)
+        par = segment_folder(input_dir, tmp_path / "par", 100, 50_000, jobs=3)
+        assert [(r.source, r.status) for r in par] == [(r.source, r.status) for r in seq]
+        assert [[c.relative_to(tmp_path / "par") for c in r.children] for r in par] == [
+            [c.relative_to(tmp_path / "seq") for c in r.children] for r in seq
+        ]
+
+    def test_parallel_fail_fast_stops_at_first_error(self, tmp_path: Path):
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        (input_dir / "aaa.txt").write_bytes(b"ok")
+        (input_dir / "bbb.doc").write_bytes(_LARGE_DOC)
+        (input_dir / "zzz.txt").write_bytes(b"ok")
+        results = segment_folder(
+            input_dir, tmp_path / "out", 10_000, 50_000, fail_fast=True, jobs=2
+        )
+        assert [r.status for r in results] == [SegmentStatus.OK, SegmentStatus.ERROR]
+
 
 # ---------------------------------------------------------------------------
 # SegmentResult dataclass
@@ -576,10 +920,10 @@ class TestSegmentFolder:
 
 
 class TestSegmentResult:
-    def test_default_children_is_empty_list(self, tmp_path: Path):
-        r = SegmentResult(source=tmp_path / "f.txt", status=SegmentStatus.OK)
+    def test_default_children_is_empty_list(self):
+        r = SegmentResult(source=Path("f.txt"), status=SegmentStatus.OK)
         assert r.children == []
 
-    def test_default_error_msg_is_empty(self, tmp_path: Path):
-        r = SegmentResult(source=tmp_path / "f.txt", status=SegmentStatus.ERROR)
+    def test_default_error_msg_is_empty(self):
+        r = SegmentResult(source=Path("f.txt"), status=SegmentStatus.ERROR)
         assert r.error_msg == ""